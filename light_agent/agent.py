@@ -1,24 +1,32 @@
 import os
+import json
+import time
+import atexit
+import logging
 import datetime
 import asyncio
+import aiohttp
 from google import genai
 from google.adk.agents import Agent
 from google.genai import types
-from kasa import Discover, KasaException, Module
+from kasa import Device, DeviceConfig, Discover, KasaException, Module
 from google.adk.tools import google_search 
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
 from google_auth_httplib2 import AuthorizedHttp
 from google_auth_oauthlib.flow import InstalledAppFlow
-from googleapiclient.discovery import build
+from googleapiclient.discovery import build, build_from_document
 from googleapiclient.errors import HttpError
 
 from typing import Optional 
 
 from .fileTools import list_files, read_file_content, write_file_content
+from .ioExecutor import run_io
 from .memoryTools import get_memory, set_memory
 from .taskTools import create_scheduled_task, list_scheduled_tasks, delete_scheduled_task
 
+logger = logging.getLogger(__name__)
+
 now = datetime.datetime.now()
 formatted_date_time = now.strftime("%A, %B %d, %Y at %I:%M %p %Z")
 
@@ -26,97 +34,340 @@ formatted_date_time = now.strftime("%A, %B %d, %Y at %I:%M %p %Z")
 
 FIRST_IP_ADDRESS = "192.168.1.165"
 SECOND_IP_ADDRESS = "192.168.1.37"
+BROADCAST_ADDRESS = "192.168.1.255"
+
+# Shared across every light op: allocated once instead of rebuilding a
+# list (and re-joining it for log lines) inside each call.
+_IPS: tuple[str, ...] = (FIRST_IP_ADDRESS, SECOND_IP_ADDRESS)
+_IPS_JOINED = ", ".join(_IPS)
+
+# Cache of discovered devices so each tool call reuses the existing object
+# instead of paying a full UDP discovery round trip per invocation.
+_DEVICE_CACHE: dict = {}
+_DEVICE_LOCKS: dict = {}
+
+# Snapshots of each device's DeviceConfig (host, connection type, etc.)
+# taken after the first successful discovery. On later cold starts we
+# connect directly from the snapshot and skip discovery negotiation.
+DEVICE_CONFIG_FILE = "kasa_device_configs.json"
+
+def _load_device_configs() -> dict:
+    if not os.path.exists(DEVICE_CONFIG_FILE):
+        return {}
+    try:
+        with open(DEVICE_CONFIG_FILE, "r", encoding="utf-8") as f:
+            content = f.read()
+            if not content:
+                return {}
+            return json.loads(content)
+    except Exception as e:
+        logger.error("[_load_device_configs] Error loading '%s': %s", DEVICE_CONFIG_FILE, e)
+        return {}
 
-async def turn_on_light() -> list[dict]:
-    """Turns the lights on."""
-    ip_addresses_to_run_on = [FIRST_IP_ADDRESS, SECOND_IP_ADDRESS]
+def _save_device_config(target_ip: str, dev):
+    try:
+        configs = _load_device_configs()
+        configs[target_ip] = dev.config.to_dict()
+        with open(DEVICE_CONFIG_FILE, "w", encoding="utf-8") as f:
+            json.dump(configs, f, indent=2)
+        logger.debug("[_save_device_config] Snapshotted device config for %s.", target_ip)
+    except Exception as e:
+        logger.error("[_save_device_config] Could not snapshot config for %s: %s", target_ip, e)
 
-    async def _execute_turn_on_for_ip(target_ip: str):
+# How long one broadcast discovery is considered fresh enough to cover
+# cache misses before another broadcast is allowed.
+_BROADCAST_TTL_SECONDS = 60
+_LAST_BROADCAST_MONOTONIC = 0.0
+_BROADCAST_LOCK = asyncio.Lock()
+
+async def _discover_all(timeout: int = 3) -> dict:
+    """
+    Fills the device cache for all known IPs with a single subnet
+    broadcast instead of one unicast discovery per device. Rate-limited
+    by a TTL so repeated cache misses don't spam the LAN.
+    """
+    global _LAST_BROADCAST_MONOTONIC
+    async with _BROADCAST_LOCK:
+        now_monotonic = time.monotonic()
+        if now_monotonic - _LAST_BROADCAST_MONOTONIC < _BROADCAST_TTL_SECONDS:
+            return _DEVICE_CACHE
+        logger.debug("[_discover_all] Broadcasting discovery to %s...", BROADCAST_ADDRESS)
+        discovered = await Discover.discover(target=BROADCAST_ADDRESS, timeout=timeout)
+        for found_ip, found_dev in discovered.items():
+            if found_ip in (FIRST_IP_ADDRESS, SECOND_IP_ADDRESS):
+                _DEVICE_CACHE[found_ip] = found_dev
+        _LAST_BROADCAST_MONOTONIC = now_monotonic
+        logger.debug("[_discover_all] Broadcast complete. Cached %s known device(s).", len(_DEVICE_CACHE))
+        return _DEVICE_CACHE
+
+def _get_device_lock(target_ip: str) -> asyncio.Lock:
+    lock = _DEVICE_LOCKS.get(target_ip)
+    if lock is None:
+        lock = asyncio.Lock()
+        _DEVICE_LOCKS[target_ip] = lock
+    return lock
+
+async def _get_device(target_ip: str, timeout: int = 5):
+    """
+    Returns a cached device for the given IP, discovering it only on the
+    first call (or after eviction). Guarded by a per-IP lock so concurrent
+    tool calls don't race to discover the same device twice.
+    """
+    async with _get_device_lock(target_ip):
+        await _await_pending_refresh(target_ip)
+        dev = _DEVICE_CACHE.get(target_ip)
+        if dev is None:
+            # A stored DeviceConfig snapshot lets us connect directly,
+            # skipping discovery and protocol negotiation entirely.
+            stored_config = (await run_io(_load_device_configs)).get(target_ip)
+            if stored_config is not None:
+                try:
+                    dev = await Device.connect(config=DeviceConfig.from_dict(stored_config))
+                    _DEVICE_CACHE[target_ip] = dev
+                    logger.debug("[_get_device] Connected to %s from stored device config.", target_ip)
+                except Exception as e:
+                    logger.error("[_get_device] Stored config connect failed for %s: %s. Falling back to discovery.", target_ip, e)
+                    dev = None
+        if dev is None:
+            # Both bulbs are fixed, known endpoints, so try connecting
+            # straight to the host with a default config before falling
+            # back to any discovery round trip at all.
+            try:
+                dev = await Device.connect(config=DeviceConfig(host=target_ip))
+                _DEVICE_CACHE[target_ip] = dev
+                await run_io(_save_device_config, target_ip, dev)
+                logger.debug("[_get_device] Connected directly to %s without discovery.", target_ip)
+            except Exception as e:
+                logger.warning("[_get_device] Direct connect to %s failed: %s. Falling back to discovery.", target_ip, e)
+                dev = None
+        if dev is None:
+            # One broadcast fills the cache for every known device at once.
+            dev = (await _discover_all()).get(target_ip)
+            if dev is not None:
+                await run_io(_save_device_config, target_ip, dev)
+        if dev is None:
+            logger.debug("[_get_device] Cache miss for %s, discovering device directly...", target_ip)
+            dev = await Discover.discover_single(target_ip, timeout=timeout)
+            if dev is not None:
+                _DEVICE_CACHE[target_ip] = dev
+                await run_io(_save_device_config, target_ip, dev)
+        return dev
+
+# Cached devices deliberately keep their protocol transport open between
+# calls so each operation reuses the established TCP/KLAP session instead
+# of paying a fresh handshake and key exchange. Transport drops surface
+# as KasaException, which evicts the device and rebuilds on next use.
+# The atexit hook below closes the sessions cleanly on shutdown.
+
+async def _close_all_devices():
+    """Disconnects every cached device transport."""
+    for target_ip, dev in list(_DEVICE_CACHE.items()):
         try:
-            print(f"\n[turn_on_light_op_for_{target_ip}] Attempting to turn ON device...")
-            dev = await Discover.discover_single(target_ip, timeout=5)
-            await dev.turn_on()
-            await dev.update()
-            is_on_state = dev.is_on
-            print(f"[turn_on_light_op_for_{target_ip}] Device is now {'ON' if is_on_state else 'OFF'}.")
-            return {
-                "ip_address": target_ip,
-                "status": "success",
-                "message": f"Successfully turned on the light at {target_ip}. Current state: {'on' if is_on_state else 'off'}"
-            }
-        except KasaException as e:
-            print(f"[turn_on_light_op_for_{target_ip}] Kasa Error: {e}")
-            return {
-                "ip_address": target_ip,
-                "status": "error",
-                "message": f"Kasa Error for {target_ip} (turn_on): {str(e)}"
-            }
-        except asyncio.TimeoutError:
-            print(f"[turn_on_light_op_for_{target_ip}] Timeout discovering device.")
-            return {
-                "ip_address": target_ip,
-                "status": "error",
-                "message": f"Timeout discovering {target_ip} (turn_on)."}
+            await dev.disconnect()
+            logger.debug("[_close_all_devices] Disconnected %s.", target_ip)
         except Exception as e:
-            print(f"[turn_on_light_op_for_{target_ip}] Unexpected error: {e}")
-            return {
+            logger.error("[_close_all_devices] Error disconnecting %s: %s", target_ip, e)
+    _DEVICE_CACHE.clear()
+
+def _close_all_devices_at_exit():
+    if not _DEVICE_CACHE:
+        return
+    try:
+        asyncio.run(_close_all_devices())
+    except Exception as e:
+        logger.error("[_close_all_devices_at_exit] Cleanup error: %s", e)
+
+atexit.register(_close_all_devices_at_exit)
+
+# Capability flags (is_dimmable / is_color) per IP, learned on the first
+# successful update so later calls can skip the pre-set refresh RPC.
+_CAPABILITY_CACHE: dict = {}
+
+def _evict_device(target_ip: str):
+    """Drops a cached device so the next call re-discovers it."""
+    _DEVICE_CACHE.pop(target_ip, None)
+    _CAPABILITY_CACHE.pop(target_ip, None)
+
+async def _get_capabilities(dev, target_ip: str) -> dict:
+    """
+    Returns cached capability flags for the device, doing the one-time
+    dev.update() needed to populate them on the first call per IP.
+    """
+    caps = _CAPABILITY_CACHE.get(target_ip)
+    if caps is None:
+        await dev.update()
+        caps = {"is_dimmable": dev.is_dimmable, "is_color": dev.is_color}
+        _CAPABILITY_CACHE[target_ip] = caps
+    return caps
+
+# Recent get_light_state results per IP. Rapid successive polls (the
+# agent reads state before most brightness/color changes) are served
+# from here instead of re-querying the device. Writes invalidate the
+# entry so the next read is fresh.
+_STATE_CACHE: dict = {}
+_STATE_CACHE_TTL_SECONDS = 2.0
+
+def _invalidate_state_cache(target_ip: str):
+    _STATE_CACHE.pop(target_ip, None)
+
+# Background dev.update() tasks started after writes, keyed by IP. The
+# refresh happens off the critical path; the next call on the device
+# awaits the task first so it never overlaps a new operation.
+_PENDING_REFRESH: dict = {}
+
+def _schedule_background_refresh(target_ip: str, dev):
+    """Refreshes the device state after a write without blocking the caller."""
+    existing = _PENDING_REFRESH.get(target_ip)
+    if existing is not None and not existing.done():
+        return
+    task = asyncio.create_task(dev.update())
+    _PENDING_REFRESH[target_ip] = task
+
+async def _await_pending_refresh(target_ip: str):
+    task = _PENDING_REFRESH.pop(target_ip, None)
+    if task is None:
+        return
+    try:
+        await task
+    except Exception as e:
+        logger.warning("[_await_pending_refresh] Background refresh failed for %s: %s", target_ip, e)
+
+# Upper bound on how long a whole multi-device operation may take before
+# stragglers are reported as timed out instead of delaying the reply.
+_GATHER_TIMEOUT_SECONDS = 8
+
+async def _gather_with_timeout(coroutines, ip_addresses, operation: str) -> list[dict]:
+    """
+    Runs the per-IP coroutines concurrently with a shared wall-time budget.
+    Devices that don't finish in time are cancelled and reported with a
+    timeout entry, so one slow or offline bulb can't stall the command
+    for the full per-device timeout. Exceptions from one device never
+    cancel the sibling operations.
+    """
+    tasks = [asyncio.ensure_future(coro) for coro in coroutines]
+    done, pending = await asyncio.wait(tasks, timeout=_GATHER_TIMEOUT_SECONDS)
+    results = []
+    for target_ip, task in zip(ip_addresses, tasks):
+        if task in pending:
+            task.cancel()
+            logger.warning("[_gather_with_timeout] %s for %s exceeded %ss budget; cancelled.", operation, target_ip, _GATHER_TIMEOUT_SECONDS)
+            results.append({
+                "ip_address": target_ip,
+                "status": "timeout",
+                "message": f"Timeout for {target_ip} ({operation}): no response within {_GATHER_TIMEOUT_SECONDS}s."
+            })
+        elif task.exception() is not None:
+            e = task.exception()
+            logger.warning("[_gather_with_timeout] %s for %s raised: %s", operation, target_ip, e)
+            results.append({
                 "ip_address": target_ip,
                 "status": "error",
-                "message": f"Unexpected error ({type(e).__name__}) for {target_ip} (turn_on): {str(e)}"
-            }
+                "message": f"Unexpected error ({type(e).__name__}) for {target_ip} ({operation}): {str(e)}"
+            })
+        else:
+            results.append(task.result())
+    return results
+
+async def turn_on_light() -> list[dict]:
+    """Turns the lights on."""
+    ip_addresses_to_run_on = _IPS
+
+    async def _execute_turn_on_for_ip(target_ip: str):
+        for attempt in range(2):
+            try:
+                logger.debug("[turn_on_light_op_for_%s] Attempting to turn ON device...", target_ip)
+                dev = await _get_device(target_ip, timeout=5)
+                await dev.turn_on()
+                _invalidate_state_cache(target_ip)
+                logger.debug("[turn_on_light_op_for_%s] Device is now ON.", target_ip)
+                return {
+                    "ip_address": target_ip,
+                    "status": "success",
+                    "state": "on",
+                    "message": f"Successfully turned on the light at {target_ip}."
+                }
+            except KasaException as e:
+                _evict_device(target_ip)
+                if attempt == 0:
+                    logger.error("[turn_on_light_op_for_%s] Kasa Error: %s. Retrying with fresh discovery...", target_ip, e)
+                    continue
+                logger.error("[turn_on_light_op_for_%s] Kasa Error: %s", target_ip, e)
+                return {
+                    "ip_address": target_ip,
+                    "status": "error",
+                    "message": f"Kasa Error for {target_ip} (turn_on): {str(e)}"
+                }
+            except asyncio.TimeoutError:
+                logger.warning("[turn_on_light_op_for_%s] Timeout discovering device.", target_ip)
+                return {
+                    "ip_address": target_ip,
+                    "status": "error",
+                    "message": f"Timeout discovering {target_ip} (turn_on)."}
+            except Exception as e:
+                logger.error("[turn_on_light_op_for_%s] Unexpected error: %s", target_ip, e)
+                return {
+                    "ip_address": target_ip,
+                    "status": "error",
+                    "message": f"Unexpected error ({type(e).__name__}) for {target_ip} (turn_on): {str(e)}"
+                }
     
-    print(f"\n[turn_on_light] Initiating turn ON for: {', '.join(ip_addresses_to_run_on)}")
+    logger.debug("[turn_on_light] Initiating turn ON for: %s", _IPS_JOINED)
     
     tasks_to_run = [_execute_turn_on_for_ip(ip) for ip in ip_addresses_to_run_on]
-    results = await asyncio.gather(*tasks_to_run)
+    results = await _gather_with_timeout(tasks_to_run, ip_addresses_to_run_on, "turn_on")
     
-    print(f"[turn_on_light] Completed turn ON operations.")
+    logger.debug("[turn_on_light] Completed turn ON operations.")
     return results
 
 async def turn_off_light() -> list[dict]:
     """Turns the lights off."""
-    ip_addresses_to_run_on = [FIRST_IP_ADDRESS, SECOND_IP_ADDRESS]
+    ip_addresses_to_run_on = _IPS
 
     async def _execute_turn_off_for_ip(target_ip: str):
-        try:
-            print(f"\n[turn_off_light_op_for_{target_ip}] Attempting to turn OFF device...")
-            dev = await Discover.discover_single(target_ip, timeout=5)
-            await dev.turn_off()
-            await dev.update()
-            is_on_state = dev.is_on
-            print(f"[turn_off_light_op_for_{target_ip}] Device is now {'ON' if is_on_state else 'OFF'}.")
-            return {
-                "ip_address": target_ip,
-                "status": "success",
-                "message": f"Successfully turned off the light at {target_ip}. Current state: {'on' if is_on_state else 'off'}"
-            }
-        except KasaException as e:
-            print(f"[turn_off_light_op_for_{target_ip}] Kasa Error: {e}")
-            return {
-                "ip_address": target_ip,
-                "status": "error",
-                "message": f"Kasa Error for {target_ip} (turn_off): {str(e)}"
-            }
-        except asyncio.TimeoutError:
-            print(f"[turn_off_light_op_for_{target_ip}] Timeout discovering device.")
-            return {
-                "ip_address": target_ip,
-                "status": "error",
-                "message": f"Timeout discovering {target_ip} (turn_off)."}
-        except Exception as e:
-            print(f"[turn_off_light_op_for_{target_ip}] Unexpected error: {e}")
-            return {
-                "ip_address": target_ip,
-                "status": "error",
-                "message": f"Unexpected error ({type(e).__name__}) for {target_ip} (turn_off): {str(e)}"
-            }
+        for attempt in range(2):
+            try:
+                logger.debug("[turn_off_light_op_for_%s] Attempting to turn OFF device...", target_ip)
+                dev = await _get_device(target_ip, timeout=5)
+                await dev.turn_off()
+                _invalidate_state_cache(target_ip)
+                logger.debug("[turn_off_light_op_for_%s] Device is now OFF.", target_ip)
+                return {
+                    "ip_address": target_ip,
+                    "status": "success",
+                    "state": "off",
+                    "message": f"Successfully turned off the light at {target_ip}."
+                }
+            except KasaException as e:
+                _evict_device(target_ip)
+                if attempt == 0:
+                    logger.error("[turn_off_light_op_for_%s] Kasa Error: %s. Retrying with fresh discovery...", target_ip, e)
+                    continue
+                logger.error("[turn_off_light_op_for_%s] Kasa Error: %s", target_ip, e)
+                return {
+                    "ip_address": target_ip,
+                    "status": "error",
+                    "message": f"Kasa Error for {target_ip} (turn_off): {str(e)}"
+                }
+            except asyncio.TimeoutError:
+                logger.warning("[turn_off_light_op_for_%s] Timeout discovering device.", target_ip)
+                return {
+                    "ip_address": target_ip,
+                    "status": "error",
+                    "message": f"Timeout discovering {target_ip} (turn_off)."}
+            except Exception as e:
+                logger.error("[turn_off_light_op_for_%s] Unexpected error: %s", target_ip, e)
+                return {
+                    "ip_address": target_ip,
+                    "status": "error",
+                    "message": f"Unexpected error ({type(e).__name__}) for {target_ip} (turn_off): {str(e)}"
+                }
     
-    print(f"\n[turn_off_light] Initiating turn OFF for: {', '.join(ip_addresses_to_run_on)}")
+    logger.debug("[turn_off_light] Initiating turn OFF for: %s", _IPS_JOINED)
     
     tasks_to_run = [_execute_turn_off_for_ip(ip) for ip in ip_addresses_to_run_on]
-    results = await asyncio.gather(*tasks_to_run)
+    results = await _gather_with_timeout(tasks_to_run, ip_addresses_to_run_on, "turn_off")
     
-    print(f"[turn_off_light] Completed turn OFF operations.")
+    logger.debug("[turn_off_light] Completed turn OFF operations.")
     return results
 
 async def set_light_brightness(brightness: int) -> list[dict]:
@@ -126,76 +377,83 @@ async def set_light_brightness(brightness: int) -> list[dict]:
         brightness (int): The desired brightness level (0-100).
                           0 effectively turns the light off, 100 is full brightness.
     """
-    ip_addresses_to_run_on = [FIRST_IP_ADDRESS, SECOND_IP_ADDRESS]
+    # Validate before spawning any per-device work so a bad value costs
+    # one dict return instead of two discovery round trips.
+    if not (0 <= brightness <= 100):
+        message = f"Invalid brightness value: {brightness}. Must be between 0 and 100."
+        logger.error("[set_light_brightness] %s", message)
+        return [{"status": "error", "message": message}]
+
+    ip_addresses_to_run_on = _IPS
 
     async def _execute_set_brightness_for_ip(target_ip: str, brightness_value: int):
         operation_name = f"set_brightness_to_{brightness_value}%"
-        try:
-            print(f"\n[{operation_name}_op_for_{target_ip}] Attempting operation...")
+        for attempt in range(2):
+            try:
+                logger.debug("[%s_op_for_%s] Attempting operation...", operation_name, target_ip)
 
-            if not (0 <= brightness_value <= 100):
-                message = f"Invalid brightness value: {brightness_value}. Must be between 0 and 100."
-                print(f"[{operation_name}_op_for_{target_ip}] {message}")
-                return {"ip_address": target_ip, "status": "error", "message": message}
+                dev = await _get_device(target_ip, timeout=7)
 
-            dev = await Discover.discover_single(target_ip, timeout=7)
+                if dev is None:
+                    message = f"Device not found at {target_ip}."
+                    logger.debug("[%s_op_for_%s] %s", operation_name, target_ip, message)
+                    return {"ip_address": target_ip, "status": "error", "message": message}
 
-            if dev is None:
-                message = f"Device not found at {target_ip}."
-                print(f"[{operation_name}_op_for_{target_ip}] {message}")
-                return {"ip_address": target_ip, "status": "error", "message": message}
+                caps = await _get_capabilities(dev, target_ip)
 
-            await dev.update()
+                if not caps["is_dimmable"]:
+                    message = f"Device {target_ip} is not dimmable."
+                    logger.debug("[%s_op_for_%s] %s", operation_name, target_ip, message)
+                    return {"ip_address": target_ip, "status": "error", "message": message}
 
-            if not dev.is_dimmable:
-                message = f"Device {target_ip} is not dimmable."
-                print(f"[{operation_name}_op_for_{target_ip}] {message}")
+                if not hasattr(dev, 'modules') or dev.modules is None:
+                    message = f"Device {target_ip} 'modules' attribute missing or None after update."
+                    logger.debug("[%s_op_for_%s] %s", operation_name, target_ip, message)
+                    return {"ip_address": target_ip, "status": "error", "message": message}
+
+                light_module = dev.modules.get(Module.Light)
+                if light_module is None:
+                    available_modules = list(dev.modules.keys()) if dev.modules else "None"
+                    message = f"Light module not found for {target_ip}. Available modules: {available_modules}"
+                    logger.debug("[%s_op_for_%s] %s", operation_name, target_ip, message)
+                    return {"ip_address": target_ip, "status": "error", "message": message}
+
+                await light_module.set_brightness(brightness_value)
+                _invalidate_state_cache(target_ip)
+                _schedule_background_refresh(target_ip, dev)
+                current_brightness = brightness_value
+
+                message = f"Successfully set brightness for {target_ip}. Current brightness: {current_brightness}%"
+                logger.debug("[%s_op_for_%s] %s", operation_name, target_ip, message)
+                return {
+                    "ip_address": target_ip,
+                    "status": "success",
+                    "brightness": current_brightness,
+                    "message": message
+                }
+            except KasaException as e:
+                _evict_device(target_ip)
+                if attempt == 0:
+                    logger.error("[%s_op_for_%s] Kasa Error: %s. Retrying with fresh discovery...", operation_name, target_ip, e)
+                    continue
+                message = f"Kasa Error for {target_ip} ({operation_name}): {str(e)}"
+                logger.debug("[%s_op_for_%s] %s", operation_name, target_ip, message)
                 return {"ip_address": target_ip, "status": "error", "message": message}
-
-            if not hasattr(dev, 'modules') or dev.modules is None:
-                message = f"Device {target_ip} 'modules' attribute missing or None after update."
-                print(f"[{operation_name}_op_for_{target_ip}] {message}")
+            except asyncio.TimeoutError:
+                message = f"Timeout during operation for {target_ip} ({operation_name})."
+                logger.debug("[%s_op_for_%s] %s", operation_name, target_ip, message)
                 return {"ip_address": target_ip, "status": "error", "message": message}
-
-            light_module = dev.modules.get(Module.Light)
-            if light_module is None:
-                available_modules = list(dev.modules.keys()) if dev.modules else "None"
-                message = f"Light module not found for {target_ip}. Available modules: {available_modules}"
-                print(f"[{operation_name}_op_for_{target_ip}] {message}")
+            except Exception as e:
+                message = f"Unexpected error for {target_ip} ({operation_name}): {type(e).__name__} - {str(e)}"
+                logger.exception("[%s_op_for_%s] %s", operation_name, target_ip, message)
                 return {"ip_address": target_ip, "status": "error", "message": message}
 
-            await light_module.set_brightness(brightness_value)
-            await dev.update()
-            current_brightness = light_module.brightness
-
-            message = f"Successfully set brightness for {target_ip}. Current brightness: {current_brightness}%"
-            print(f"[{operation_name}_op_for_{target_ip}] {message}")
-            return {
-                "ip_address": target_ip,
-                "status": "success",
-                "brightness": current_brightness,
-                "message": message
-            }
-        except KasaException as e:
-            message = f"Kasa Error for {target_ip} ({operation_name}): {str(e)}"
-            print(f"[{operation_name}_op_for_{target_ip}] {message}")
-            return {"ip_address": target_ip, "status": "error", "message": message}
-        except asyncio.TimeoutError:
-            message = f"Timeout during operation for {target_ip} ({operation_name})."
-            print(f"[{operation_name}_op_for_{target_ip}] {message}")
-            return {"ip_address": target_ip, "status": "error", "message": message}
-        except Exception as e:
-            message = f"Unexpected error for {target_ip} ({operation_name}): {type(e).__name__} - {str(e)}"
-            print(f"[{operation_name}_op_for_{target_ip}] {message}")
-            traceback.print_exc()
-            return {"ip_address": target_ip, "status": "error", "message": message}
-
-    print(f"\n[set_light_brightness] Initiating set brightness to {brightness}% for: {', '.join(ip_addresses_to_run_on)}")
+    logger.debug("[set_light_brightness] Initiating set brightness to %s%% for: %s", brightness, _IPS_JOINED)
 
     tasks_to_run = [_execute_set_brightness_for_ip(ip, brightness) for ip in ip_addresses_to_run_on]
-    results = await asyncio.gather(*tasks_to_run)
+    results = await _gather_with_timeout(tasks_to_run, ip_addresses_to_run_on, "set_brightness")
 
-    print(f"[set_light_brightness] Completed set brightness operations.")
+    logger.debug("[set_light_brightness] Completed set brightness operations.")
     return results
 
 async def set_light_hsv(hue: int, saturation: int, value: int) -> list[dict]:
@@ -206,82 +464,89 @@ async def set_light_hsv(hue: int, saturation: int, value: int) -> list[dict]:
         saturation (int): The desired saturation (0-100 percent).
         value (int): The desired value/brightness (0-100 percent).
     """
-    ip_addresses_to_run_on = [FIRST_IP_ADDRESS, SECOND_IP_ADDRESS]
+    # Validate before spawning any per-device work so a bad value costs
+    # one dict return instead of two discovery round trips.
+    if not (0 <= hue <= 360):
+        message = f"Invalid hue value: {hue}. Must be between 0 and 360."
+        logger.error("[set_light_hsv] %s", message)
+        return [{"status": "error", "message": message}]
+    if not (0 <= saturation <= 100):
+        message = f"Invalid saturation value: {saturation}. Must be between 0 and 100."
+        logger.error("[set_light_hsv] %s", message)
+        return [{"status": "error", "message": message}]
+    if not (0 <= value <= 100):
+        message = f"Invalid value/brightness: {value}. Must be between 0 and 100."
+        logger.error("[set_light_hsv] %s", message)
+        return [{"status": "error", "message": message}]
+
+    ip_addresses_to_run_on = _IPS
 
     async def _execute_set_hsv_for_ip(target_ip: str, hue_val: int, sat_val: int, val_val: int):
         operation_name = f"set_hsv_to_({hue_val},{sat_val},{val_val})"
-        try:
-            print(f"\n[{operation_name}_op_for_{target_ip}] Attempting operation...")
+        for attempt in range(2):
+            try:
+                logger.debug("[%s_op_for_%s] Attempting operation...", operation_name, target_ip)
 
-            if not (0 <= hue_val <= 360):
-                message = f"Invalid hue value: {hue_val}. Must be between 0 and 360."
-                print(f"[{operation_name}_op_for_{target_ip}] {message}")
-                return {"ip_address": target_ip, "status": "error", "message": message}
-            if not (0 <= sat_val <= 100):
-                message = f"Invalid saturation value: {sat_val}. Must be between 0 and 100."
-                print(f"[{operation_name}_op_for_{target_ip}] {message}")
-                return {"ip_address": target_ip, "status": "error", "message": message}
-            if not (0 <= val_val <= 100):
-                message = f"Invalid value/brightness: {val_val}. Must be between 0 and 100."
-                print(f"[{operation_name}_op_for_{target_ip}] {message}")
-                return {"ip_address": target_ip, "status": "error", "message": message}
+                dev = await _get_device(target_ip, timeout=7)
 
-            dev = await Discover.discover_single(target_ip, timeout=7)
+                if dev is None:
+                    message = f"Device not found at {target_ip}."
+                    logger.debug("[%s_op_for_%s] %s", operation_name, target_ip, message)
+                    return {"ip_address": target_ip, "status": "error", "message": message}
 
-            if dev is None:
-                message = f"Device not found at {target_ip}."
-                print(f"[{operation_name}_op_for_{target_ip}] {message}")
-                return {"ip_address": target_ip, "status": "error", "message": message}
+                caps = await _get_capabilities(dev, target_ip)
 
-            await dev.update()
+                if not caps["is_color"]:
+                    message = f"Device {target_ip} does not support color (HSV) changes."
+                    logger.debug("[%s_op_for_%s] %s", operation_name, target_ip, message)
+                    return {"ip_address": target_ip, "status": "error", "message": message}
 
-            if not dev.is_color:
-                message = f"Device {target_ip} does not support color (HSV) changes."
-                print(f"[{operation_name}_op_for_{target_ip}] {message}")
+                if not hasattr(dev, 'modules') or dev.modules is None:
+                    message = f"Device {target_ip} 'modules' attribute missing or None after update."
+                    logger.debug("[%s_op_for_%s] %s", operation_name, target_ip, message)
+                    return {"ip_address": target_ip, "status": "error", "message": message}
+
+                light_module = dev.modules.get(Module.Light)
+                if light_module is None:
+                    available_modules = list(dev.modules.keys()) if dev.modules else "None"
+                    message = f"Light module not found for {target_ip}. Available modules: {available_modules}"
+                    logger.debug("[%s_op_for_%s] %s", operation_name, target_ip, message)
+                    return {"ip_address": target_ip, "status": "error", "message": message}
+
+                await light_module.set_hsv(hue_val, sat_val, val_val)
+                _invalidate_state_cache(target_ip)
+                _schedule_background_refresh(target_ip, dev)
+                current_hsv = (hue_val, sat_val, val_val)
+
+                message = f"Successfully set HSV for {target_ip}. Current HSV: {current_hsv}"
+                logger.debug("[%s_op_for_%s] %s", operation_name, target_ip, message)
+                return {
+                    "ip_address": target_ip,
+                    "status": "success",
+                    "hsv": current_hsv,
+                    "message": message
+                }
+            except KasaException as e:
+                _evict_device(target_ip)
+                if attempt == 0:
+                    logger.error("[%s_op_for_%s] Kasa Error: %s. Retrying with fresh discovery...", operation_name, target_ip, e)
+                    continue
+                message = f"Kasa Error for {target_ip} ({operation_name}): {str(e)}"
+                logger.debug("[%s_op_for_%s] %s", operation_name, target_ip, message)
                 return {"ip_address": target_ip, "status": "error", "message": message}
-
-            if not hasattr(dev, 'modules') or dev.modules is None:
-                message = f"Device {target_ip} 'modules' attribute missing or None after update."
-                print(f"[{operation_name}_op_for_{target_ip}] {message}")
+            except asyncio.TimeoutError:
+                message = f"Timeout during operation for {target_ip} ({operation_name})."
+                logger.debug("[%s_op_for_%s] %s", operation_name, target_ip, message)
                 return {"ip_address": target_ip, "status": "error", "message": message}
-
-            light_module = dev.modules.get(Module.Light)
-            if light_module is None:
-                available_modules = list(dev.modules.keys()) if dev.modules else "None"
-                message = f"Light module not found for {target_ip}. Available modules: {available_modules}"
-                print(f"[{operation_name}_op_for_{target_ip}] {message}")
+            except Exception as e:
+                message = f"Unexpected error for {target_ip} ({operation_name}): {type(e).__name__} - {str(e)}"
+                logger.exception("[%s_op_for_%s] %s", operation_name, target_ip, message)
                 return {"ip_address": target_ip, "status": "error", "message": message}
 
-            await light_module.set_hsv(hue_val, sat_val, val_val)
-            await dev.update()
-            current_hsv = light_module.hsv
-
-            message = f"Successfully set HSV for {target_ip}. Current HSV: {current_hsv}"
-            print(f"[{operation_name}_op_for_{target_ip}] {message}")
-            return {
-                "ip_address": target_ip,
-                "status": "success",
-                "hsv": current_hsv,
-                "message": message
-            }
-        except KasaException as e:
-            message = f"Kasa Error for {target_ip} ({operation_name}): {str(e)}"
-            print(f"[{operation_name}_op_for_{target_ip}] {message}")
-            return {"ip_address": target_ip, "status": "error", "message": message}
-        except asyncio.TimeoutError:
-            message = f"Timeout during operation for {target_ip} ({operation_name})."
-            print(f"[{operation_name}_op_for_{target_ip}] {message}")
-            return {"ip_address": target_ip, "status": "error", "message": message}
-        except Exception as e:
-            message = f"Unexpected error for {target_ip} ({operation_name}): {type(e).__name__} - {str(e)}"
-            print(f"[{operation_name}_op_for_{target_ip}] {message}")
-            traceback.print_exc()
-            return {"ip_address": target_ip, "status": "error", "message": message}
-
-    print(f"\n[set_light_hsv] Initiating set HSV to ({hue},{saturation},{value}) for: {', '.join(ip_addresses_to_run_on)}")
+    logger.debug("[set_light_hsv] Initiating set HSV to (%s,%s,%s) for: %s", hue, saturation, value, _IPS_JOINED)
     tasks_to_run = [_execute_set_hsv_for_ip(ip, hue, saturation, value) for ip in ip_addresses_to_run_on]
-    results = await asyncio.gather(*tasks_to_run)
-    print(f"[set_light_hsv] Completed set HSV operations.")
+    results = await _gather_with_timeout(tasks_to_run, ip_addresses_to_run_on, "set_hsv")
+    logger.debug("[set_light_hsv] Completed set HSV operations.")
     return results
 
 async def get_light_state() -> list[dict]:
@@ -289,90 +554,102 @@ async def get_light_state() -> list[dict]:
     Gets the current state of the lights (on/off, HSV, brightness).
     Includes dev.update() to ensure properties are populated.
     """
-    ip_addresses_to_run_on = [FIRST_IP_ADDRESS, SECOND_IP_ADDRESS]
+    ip_addresses_to_run_on = _IPS
 
     async def _execute_get_state_for_ip(target_ip: str) -> dict:
+        cached = _STATE_CACHE.get(target_ip)
+        if cached is not None and time.monotonic() - cached[0] < _STATE_CACHE_TTL_SECONDS:
+            logger.debug("[get_light_state_op_for_%s] Returning cached state (fresh within %ss).", target_ip, _STATE_CACHE_TTL_SECONDS)
+            return cached[1]
+
         is_on_state = "N/A"
         hsv_state = "N/A"
         brightness_state = "N/A"
 
-        try:
-            print(f"\n[get_light_state_op_for_{target_ip}] Attempting to discover device...")
-            dev = await Discover.discover_single(target_ip, timeout=10)
-            
-            if dev is None:
-                print(f"[get_light_state_op_for_{target_ip}] Device not found (discover_single returned None).")
-                return {
-                    "ip_address": target_ip, "status": "error",
-                    "message": f"Device not found at {target_ip} (get_state)."
-                }
+        for attempt in range(2):
+            try:
+                logger.debug("[get_light_state_op_for_%s] Attempting to discover device...", target_ip)
+                dev = await _get_device(target_ip, timeout=10)
 
-            print(f"[get_light_state_op_for_{target_ip}] Device discovered. Attempting to update device state...")
-            await dev.update()
-            print(f"[get_light_state_op_for_{target_ip}] Device state update complete.")
+                if dev is None:
+                    logger.warning("[get_light_state_op_for_%s] Device not found (discover_single returned None).", target_ip)
+                    return {
+                        "ip_address": target_ip, "status": "error",
+                        "message": f"Device not found at {target_ip} (get_state)."
+                    }
 
-            try:
-                is_on_state = dev.is_on
-            except AttributeError:
-                print(f"[get_light_state_op_for_{target_ip}] Device has no 'is_on' attribute after update.")
-                is_on_state = "N/A (is_on attribute missing)"
+                logger.debug("[get_light_state_op_for_%s] Device discovered. Attempting to update device state...", target_ip)
+                await dev.update()
+                logger.debug("[get_light_state_op_for_%s] Device state update complete.", target_ip)
 
-            try:
-                if not hasattr(dev, 'modules') or dev.modules is None:
-                    print(f"[get_light_state_op_for_{target_ip}] Device 'modules' attribute is missing or is None after update.")
-                    hsv_state = "N/A (modules unavailable)"
-                    brightness_state = "N/A (modules unavailable)"
-                else:
-                    light_module = dev.modules.get(Module.Light)
-                    if light_module is None:
-                        print(f"[get_light_state_op_for_{target_ip}] Light module (Module.Light) not found in dev.modules or is None after update.")
-                        hsv_state = "N/A (light module missing)"
-                        brightness_state = "N/A (light module missing)"
+                try:
+                    is_on_state = dev.is_on
+                except AttributeError:
+                    logger.debug("[get_light_state_op_for_%s] Device has no 'is_on' attribute after update.", target_ip)
+                    is_on_state = "N/A (is_on attribute missing)"
+
+                try:
+                    if not hasattr(dev, 'modules') or dev.modules is None:
+                        logger.debug("[get_light_state_op_for_%s] Device 'modules' attribute is missing or is None after update.", target_ip)
+                        hsv_state = "N/A (modules unavailable)"
+                        brightness_state = "N/A (modules unavailable)"
                     else:
-                        try:
-                            hsv_state = light_module.hsv
-                        except AttributeError:
-                            print(f"[get_light_state_op_for_{target_ip}] Light module has no 'hsv' attribute.")
-                            hsv_state = "N/A (hsv not supported)"
-                        try:
-                            brightness_state = light_module.brightness
-                        except AttributeError:
-                            print(f"[get_light_state_op_for_{target_ip}] Light module has no 'brightness' attribute.")
-                            brightness_state = "N/A (brightness not supported)"
-            
-            except KeyError as e_key:
-                 print(f"[get_light_state_op_for_{target_ip}] Key error accessing module details after update: {e_key}")
-                 hsv_state = "N/A (module key error)"
-                 brightness_state = "N/A (module key error)"
-            except AttributeError as e_attr_modules:
-                 print(f"[get_light_state_op_for_{target_ip}] Attribute error with dev.modules structure after update: {e_attr_modules}")
-                 hsv_state = "N/A (modules attribute error)"
-                 brightness_state = "N/A (modules attribute error)"
-
-            print(f"[get_light_state_op_for_{target_ip}] Device state: On={is_on_state}, HSV={hsv_state}, Brightness={brightness_state}")
-            return {
-                "ip_address": target_ip, "status": "success",
-                "data": {"is_on": is_on_state, "hsv": hsv_state, "brightness": brightness_state},
-                "message": f"Successfully retrieved state for {target_ip}."
-            }
-        
-        except KasaException as e:
-            print(f"[get_light_state_op_for_{target_ip}] Kasa Error: {e}")
-            return {"ip_address": target_ip, "status": "error", "message": f"Kasa Error for {target_ip} (get_state): {str(e)}"}
-        except asyncio.TimeoutError:
-            print(f"[get_light_state_op_for_{target_ip}] Timeout (discovery or update): {e}")
-            return {"ip_address": target_ip, "status": "error", "message": f"Timeout for {target_ip} (get_state)."}
-        except AttributeError as e: 
-            print(f"[get_light_state_op_for_{target_ip}] General AttributeError: {e}")
-            return {"ip_address": target_ip, "status": "error", "message": f"General AttributeError for {target_ip} (get_state): {str(e)}"}
-        except Exception as e:
-            print(f"[get_light_state_op_for_{target_ip}] Unexpected error: {e} ({type(e).__name__})")
-            return {"ip_address": target_ip, "status": "error", "message": f"Unexpected error ({type(e).__name__}) for {target_ip} (get_state): {str(e)}"}
+                        light_module = dev.modules.get(Module.Light)
+                        if light_module is None:
+                            logger.warning("[get_light_state_op_for_%s] Light module (Module.Light) not found in dev.modules or is None after update.", target_ip)
+                            hsv_state = "N/A (light module missing)"
+                            brightness_state = "N/A (light module missing)"
+                        else:
+                            try:
+                                hsv_state = light_module.hsv
+                            except AttributeError:
+                                logger.debug("[get_light_state_op_for_%s] Light module has no 'hsv' attribute.", target_ip)
+                                hsv_state = "N/A (hsv not supported)"
+                            try:
+                                brightness_state = light_module.brightness
+                            except AttributeError:
+                                logger.debug("[get_light_state_op_for_%s] Light module has no 'brightness' attribute.", target_ip)
+                                brightness_state = "N/A (brightness not supported)"
+
+                except KeyError as e_key:
+                     logger.error("[get_light_state_op_for_%s] Key error accessing module details after update: %s", target_ip, e_key)
+                     hsv_state = "N/A (module key error)"
+                     brightness_state = "N/A (module key error)"
+                except AttributeError as e_attr_modules:
+                     logger.error("[get_light_state_op_for_%s] Attribute error with dev.modules structure after update: %s", target_ip, e_attr_modules)
+                     hsv_state = "N/A (modules attribute error)"
+                     brightness_state = "N/A (modules attribute error)"
+
+                logger.debug("[get_light_state_op_for_%s] Device state: On=%s, HSV=%s, Brightness=%s", target_ip, is_on_state, hsv_state, brightness_state)
+                result = {
+                    "ip_address": target_ip, "status": "success",
+                    "data": {"is_on": is_on_state, "hsv": hsv_state, "brightness": brightness_state},
+                    "message": f"Successfully retrieved state for {target_ip}."
+                }
+                _STATE_CACHE[target_ip] = (time.monotonic(), result)
+                return result
+
+            except KasaException as e:
+                _evict_device(target_ip)
+                if attempt == 0:
+                    logger.error("[get_light_state_op_for_%s] Kasa Error: %s. Retrying with fresh discovery...", target_ip, e)
+                    continue
+                logger.error("[get_light_state_op_for_%s] Kasa Error: %s", target_ip, e)
+                return {"ip_address": target_ip, "status": "error", "message": f"Kasa Error for {target_ip} (get_state): {str(e)}"}
+            except asyncio.TimeoutError:
+                logger.warning("[get_light_state_op_for_%s] Timeout (discovery or update).", target_ip)
+                return {"ip_address": target_ip, "status": "error", "message": f"Timeout for {target_ip} (get_state)."}
+            except AttributeError as e:
+                logger.error("[get_light_state_op_for_%s] General AttributeError: %s", target_ip, e)
+                return {"ip_address": target_ip, "status": "error", "message": f"General AttributeError for {target_ip} (get_state): {str(e)}"}
+            except Exception as e:
+                logger.error("[get_light_state_op_for_%s] Unexpected error: %s (%s)", target_ip, e, type(e).__name__)
+                return {"ip_address": target_ip, "status": "error", "message": f"Unexpected error ({type(e).__name__}) for {target_ip} (get_state): {str(e)}"}
 
-    print(f"\n[get_light_state] Initiating state retrieval for: {', '.join(ip_addresses_to_run_on)}")
+    logger.debug("[get_light_state] Initiating state retrieval for: %s", _IPS_JOINED)
     tasks_to_run = [_execute_get_state_for_ip(ip) for ip in ip_addresses_to_run_on]
-    results = await asyncio.gather(*tasks_to_run)
-    print(f"[get_light_state] Completed state retrieval operations.")
+    results = await _gather_with_timeout(tasks_to_run, ip_addresses_to_run_on, "get_state")
+    logger.debug("[get_light_state] Completed state retrieval operations.")
     return results
 
 # // google calendar
@@ -382,86 +659,300 @@ CALENDAR_ID = "<id>@group.calendar.google.com"
 TOKEN_FILE = "token.json"
 CREDENTIALS_FILE = "credentials.json"
 
-async def list_calendar_events() -> dict:
-    print("\n[list_calendar_events] Initiating process to list calendar events...")
-    creds = None
+# Credentials and the built Calendar service are cached at module scope so
+# each tool call skips the token-file read and the expensive discovery-doc
+# build(). The lock keeps concurrent calls from racing on load/refresh.
+_CREDS: Optional[Credentials] = None
+_SERVICE = None
+_CREDS_LOCK = asyncio.Lock()
+
+# Access token from the last persisted credentials. When a refresh hands
+# back the same token there is nothing new to serialize or write.
+_LAST_SAVED_TOKEN: Optional[str] = None
 
-    if os.path.exists(TOKEN_FILE):
+def _write_token(path: str, data: str):
+    """
+    Synchronous token write, run in a single worker-thread hop. Written
+    to a temp file and renamed into place so a crash mid-write can't
+    leave a truncated token.json that forces manual re-authentication.
+    """
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+# Local snapshot of the Calendar v3 discovery document. When present,
+# build_from_document skips the discovery fetch/parse that build()
+# performs and constructs the resource tree straight from the file.
+DISCOVERY_DOC_FILE = "calendar_v3_discovery.json"
+
+def _build_calendar_service(creds):
+    """
+    Builds the Calendar service, preferring a locally cached discovery
+    document. The document is snapshotted after the first build() so
+    later cold starts never touch the discovery endpoint.
+    """
+    if os.path.exists(DISCOVERY_DOC_FILE):
         try:
-            creds = await asyncio.to_thread(Credentials.from_authorized_user_file, TOKEN_FILE, SCOPES)
-            print(f"[list_calendar_events] Successfully loaded credentials from '{TOKEN_FILE}'.")
+            with open(DISCOVERY_DOC_FILE, "r", encoding="utf-8") as f:
+                discovery_doc = f.read()
+            logger.debug("[_build_calendar_service] Building service from cached discovery document.")
+            return build_from_document(discovery_doc, credentials=creds)
         except Exception as e:
-            print(f"[list_calendar_events] Error loading credentials from '{TOKEN_FILE}': {e}")
-            return {
-                "calendar_id": CALENDAR_ID,
-                "status": "error",
-                "message": f"Error loading token file '{TOKEN_FILE}': {str(e)}",
-                "events": []
-            }
-    else:
-        print(f"[list_calendar_events] Token file '{TOKEN_FILE}' not found.")
-        return {
-            "calendar_id": CALENDAR_ID,
-            "status": "error",
-            "message": f"Authentication token file '{TOKEN_FILE}' not found. Please ensure it exists.",
-            "events": []
-        }
+            logger.warning("[_build_calendar_service] Could not build from '%s': %s. Falling back to build().", DISCOVERY_DOC_FILE, e)
+    service = build(
+        "calendar", "v3", credentials=creds,
+        cache_discovery=False, static_discovery=True,
+    )
+    try:
+        root_desc = getattr(service, "_rootDesc", None)
+        if root_desc:
+            with open(DISCOVERY_DOC_FILE, "w", encoding="utf-8") as f:
+                json.dump(root_desc, f)
+            logger.debug("[_build_calendar_service] Snapshotted discovery document to '%s'.", DISCOVERY_DOC_FILE)
+    except Exception as e:
+        logger.warning("[_build_calendar_service] Could not snapshot discovery document: %s", e)
+    return service
+
+async def _load_and_refresh_creds():
+    """
+    Returns (creds, None) on success or (None, error_message) on failure.
+    Loads credentials from TOKEN_FILE once and refreshes them only when
+    expired. Must be called with _CREDS_LOCK held.
+    """
+    global _CREDS, _SERVICE, _LAST_SAVED_TOKEN
+    if _CREDS is None:
+        # No os.path.exists pre-stat: just attempt the load and let a
+        # missing file surface as FileNotFoundError.
+        try:
+            _CREDS = await run_io(Credentials.from_authorized_user_file, TOKEN_FILE, SCOPES)
+            logger.debug("[_load_and_refresh_creds] Successfully loaded credentials from '%s'.", TOKEN_FILE)
+        except FileNotFoundError:
+            logger.warning("[_load_and_refresh_creds] Token file '%s' not found.", TOKEN_FILE)
+            return None, f"Authentication token file '{TOKEN_FILE}' not found. Please ensure it exists."
+        except Exception as e:
+            logger.error("[_load_and_refresh_creds] Error loading credentials from '%s': %s", TOKEN_FILE, e)
+            return None, f"Error loading token file '{TOKEN_FILE}': {str(e)}"
 
-    if not creds or not creds.valid:
-        if creds and creds.expired and creds.refresh_token:
-            print("[list_calendar_events] Credentials expired. Attempting to refresh token...")
+    if not _CREDS.valid:
+        if _CREDS.expired and _CREDS.refresh_token:
+            logger.debug("[_load_and_refresh_creds] Credentials expired. Attempting to refresh token...")
             try:
-                await asyncio.to_thread(creds.refresh, Request())
-                print("[list_calendar_events] Credentials refreshed successfully.")
-                try:
-                    with open(TOKEN_FILE, "w") as token_file_handle:
-                        creds_json = await asyncio.to_thread(creds.to_json)
-                        await asyncio.to_thread(token_file_handle.write, creds_json)
-                    print(f"[list_calendar_events] Updated token saved to '{TOKEN_FILE}'.")
-                except Exception as e:
-                    print(f"[list_calendar_events] Failed to save refreshed token to '{TOKEN_FILE}': {e}")
+                await run_io(_CREDS.refresh, Request())
+                logger.debug("[_load_and_refresh_creds] Credentials refreshed successfully.")
+                _SERVICE = None
+                if _CREDS.token != _LAST_SAVED_TOKEN:
+                    try:
+                        creds_json = _CREDS.to_json()
+                        await run_io(_write_token, TOKEN_FILE, creds_json)
+                        _LAST_SAVED_TOKEN = _CREDS.token
+                        logger.debug("[_load_and_refresh_creds] Updated token saved to '%s'.", TOKEN_FILE)
+                    except Exception as e:
+                        logger.error("[_load_and_refresh_creds] Failed to save refreshed token to '%s': %s", TOKEN_FILE, e)
+                else:
+                    logger.debug("[_load_and_refresh_creds] Token unchanged after refresh; skipping save.")
             except Exception as e:
-                print(f"[list_calendar_events] Error refreshing token: {e}")
-                return {
-                    "calendar_id": CALENDAR_ID,
-                    "status": "error",
-                    "message": f"Error refreshing access token: {str(e)}. Manual re-authentication may be required.",
-                    "events": []
-                }
+                logger.error("[_load_and_refresh_creds] Error refreshing token: %s", e)
+                return None, f"Error refreshing access token: {str(e)}. Manual re-authentication may be required."
         else:
-            print("[list_calendar_events] Credentials are not valid and cannot be refreshed (e.g., no refresh token).")
-            return {
-                "calendar_id": CALENDAR_ID,
-                "status": "error",
-                "message": "Credentials are not valid and cannot be refreshed. Manual re-authentication may be required.",
-                "events": []
-            }
+            logger.debug("[_load_and_refresh_creds] Credentials are not valid and cannot be refreshed (e.g., no refresh token).")
+            return None, "Credentials are not valid and cannot be refreshed. Manual re-authentication may be required."
 
+    return _CREDS, None
+
+async def _get_calendar_service():
+    """
+    Returns (service, None) on success or (None, error_message) on failure.
+    Delegates credential bootstrap to _load_and_refresh_creds and builds
+    the Calendar service a single time per process.
+    """
+    global _SERVICE
+    async with _CREDS_LOCK:
+        creds, creds_error = await _load_and_refresh_creds()
+        if creds_error:
+            return None, creds_error
+
+        if _SERVICE is None:
+            logger.debug("[_get_calendar_service] Building Google Calendar service...")
+            _SERVICE = await run_io(_build_calendar_service, creds)
+        return _SERVICE, None
+
+# Calendar mutations issued back-to-back within this window are packed
+# into one multipart batch HTTP request instead of N HTTPS round trips.
+_BATCH_WINDOW_SECONDS = 0.05
+_PENDING_CALENDAR_OPS: list = []
+_BATCH_FLUSH_TASK = None
+
+# One keep-alive HTTP session for single calendar requests. httplib2
+# (used by execute()) opens a fresh TLS connection per call; reusing a
+# pooled aiohttp session amortizes the handshake across calls.
+_HTTP_SESSION: Optional[aiohttp.ClientSession] = None
+
+async def _get_http_session() -> aiohttp.ClientSession:
+    global _HTTP_SESSION
+    if _HTTP_SESSION is None or _HTTP_SESSION.closed:
+        _HTTP_SESSION = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=20, keepalive_timeout=60)
+        )
+    return _HTTP_SESSION
+
+def _close_http_session_at_exit():
+    if _HTTP_SESSION is None or _HTTP_SESSION.closed:
+        return
     try:
-        print(f"[list_calendar_events] Building Google Calendar service for calendar: {CALENDAR_ID}")
-        service = await asyncio.to_thread(build, "calendar", "v3", credentials=creds)
+        asyncio.run(_HTTP_SESSION.close())
+    except Exception as e:
+        logger.error("[_close_http_session_at_exit] Cleanup error: %s", e)
+
+atexit.register(_close_http_session_at_exit)
+
+async def _execute_single_request(http_request):
+    """
+    Executes one prepared googleapiclient HttpRequest over the shared
+    aiohttp session. Retries once after a forced credential refresh if
+    the API answers 401.
+    """
+    session = await _get_http_session()
+    headers = {k: v for k, v in (http_request.headers or {}).items()
+               if k.lower() != "content-length"}
+    for attempt in range(2):
+        async with _CREDS_LOCK:
+            creds, creds_error = await _load_and_refresh_creds()
+            if creds_error:
+                raise RuntimeError(creds_error)
+            if attempt > 0:
+                await run_io(creds.refresh, Request())
+        headers["Authorization"] = f"Bearer {creds.token}"
+        async with session.request(
+            http_request.method, http_request.uri,
+            data=http_request.body, headers=headers,
+        ) as resp:
+            if resp.status == 401 and attempt == 0:
+                logger.warning("[_execute_single_request] 401 from Calendar API; refreshing credentials and retrying.")
+                continue
+            if resp.status >= 400:
+                error_text = await resp.text()
+                raise RuntimeError(f"Calendar API HTTP {resp.status}: {error_text}")
+            response_text = await resp.text()
+            return json.loads(response_text) if response_text else {}
+
+async def _submit_calendar_request(http_request):
+    """
+    Queues a prepared googleapiclient HttpRequest and awaits its result.
+    Requests that arrive within the coalescing window are flushed together
+    through service.new_batch_http_request(), so a burst of creates or
+    deletes costs a single HTTPS round trip.
+    """
+    global _BATCH_FLUSH_TASK
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+    _PENDING_CALENDAR_OPS.append((http_request, future))
+    if _BATCH_FLUSH_TASK is None or _BATCH_FLUSH_TASK.done():
+        _BATCH_FLUSH_TASK = asyncio.create_task(_flush_calendar_batch())
+    return await future
+
+async def _flush_calendar_batch():
+    # Loops until a wake-up finds the queue empty: a request appended
+    # while a flush is mid-execution sees _BATCH_FLUSH_TASK.done() ==
+    # False and schedules nothing, so the running task must come back
+    # for it or its future would never resolve.
+    while True:
+        await asyncio.sleep(_BATCH_WINDOW_SECONDS)
+        pending = _PENDING_CALENDAR_OPS[:]
+        del _PENDING_CALENDAR_OPS[:len(pending)]
+        if not pending:
+            return
+        await _flush_calendar_batch_once(pending)
+
+async def _flush_calendar_batch_once(pending):
+    service, service_error = await _get_calendar_service()
+    if service_error:
+        for _, future in pending:
+            if not future.done():
+                future.set_exception(RuntimeError(service_error))
+        return
+
+    if len(pending) == 1:
+        # A lone request isn't worth the multipart framing overhead.
+        http_request, future = pending[0]
+        try:
+            result = await _execute_single_request(http_request)
+            if not future.done():
+                future.set_result(result)
+        except Exception as e:
+            if not future.done():
+                future.set_exception(e)
+        return
 
-        now = datetime.datetime.now(tz=datetime.timezone.utc).isoformat()
-        print(f"[list_calendar_events] Fetching upcoming events (max 10) since {now}.")
+    logger.debug("[_flush_calendar_batch] Flushing %s calendar request(s) in one batch.", len(pending))
+    batch = service.new_batch_http_request()
+    outcomes = {}
+
+    def _record(request_id, response, exception):
+        outcomes[request_id] = (response, exception)
+
+    for index, (http_request, _) in enumerate(pending):
+        batch.add(http_request, callback=_record, request_id=str(index))
+
+    try:
+        await run_io(batch.execute)
+    except Exception as e:
+        for _, future in pending:
+            if not future.done():
+                future.set_exception(e)
+        return
+
+    for index, (_, future) in enumerate(pending):
+        response, exception = outcomes.get(str(index), (None, None))
+        if future.done():
+            continue
+        if exception is not None:
+            future.set_exception(exception)
+        else:
+            future.set_result(response)
+
+async def list_calendar_events() -> dict:
+    logger.debug("[list_calendar_events] Initiating process to list calendar events...")
+
+    service, service_error = await _get_calendar_service()
+    if service_error:
+        return {
+            "calendar_id": CALENDAR_ID,
+            "status": "error",
+            "message": service_error,
+            "events": []
+        }
+
+    try:
+        # RFC3339 via one C-level strftime call; also stops shadowing the
+        # module-level `now` used for formatted_date_time.
+        time_min = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+        logger.debug("[list_calendar_events] Fetching upcoming events (max 10) since %s.", time_min)
 
         def get_events_sync():
             return (
                 service.events()
                 .list(
                     calendarId=CALENDAR_ID,
-                    timeMin=now,
+                    timeMin=time_min,
                     maxResults=10,
                     singleEvents=True,
                     orderBy="startTime",
+                    # Projection pushdown: only the fields the model
+                    # actually uses, instead of full event resources
+                    # (attendees, conferenceData, reminders, ...).
+                    fields="items(id,summary,start,end,description),nextPageToken",
                 )
                 .execute()
             )
 
-        events_result = await asyncio.to_thread(get_events_sync)
+        events_result = await run_io(get_events_sync)
         api_events_list = events_result.get("items", [])
 
         if not api_events_list:
-            print(f"[list_calendar_events] No upcoming events found for calendar: {CALENDAR_ID}.")
+            logger.debug("[list_calendar_events] No upcoming events found for calendar: %s.", CALENDAR_ID)
             return {
                 "calendar_id": CALENDAR_ID,
                 "status": "success",
@@ -470,15 +961,15 @@ async def list_calendar_events() -> dict:
             }
 
         processed_events = []
-        print(f"[list_calendar_events] Processing {len(api_events_list)} fetched event(s).")
+        logger.debug("[list_calendar_events] Processing %s fetched event(s).", len(api_events_list))
         for event_item in api_events_list:
             start_time = event_item["start"].get("dateTime", event_item["start"].get("date"))
             summary_text = event_item["summary"]
             event_id = event_item["id"]
             processed_events.append({"start": start_time, "summary": summary_text, "event_id": event_id})
-            print(f"  ID: {event_id} - Event: {start_time} - {summary_text}")
+            logger.debug("  ID: %s - Event: %s - %s", event_id, start_time, summary_text)
 
-        print(f"[list_calendar_events] Successfully processed {len(processed_events)} events.")
+        logger.debug("[list_calendar_events] Successfully processed %s events.", len(processed_events))
         return {
             "calendar_id": CALENDAR_ID,
             "status": "success",
@@ -487,7 +978,7 @@ async def list_calendar_events() -> dict:
         }
 
     except HttpError as error:
-        print(f"[list_calendar_events] Google API HttpError occurred: {error}")
+        logger.error("[list_calendar_events] Google API HttpError occurred: %s", error)
         return {
             "calendar_id": CALENDAR_ID,
             "status": "error",
@@ -495,7 +986,7 @@ async def list_calendar_events() -> dict:
             "events": []
         }
     except Exception as e:
-        print(f"[list_calendar_events] An unexpected error occurred: {type(e).__name__} - {e}")
+        logger.error("[list_calendar_events] An unexpected error occurred: %s - %s", type(e).__name__, e)
         return {
             "calendar_id": CALENDAR_ID,
             "status": "error",
@@ -509,36 +1000,11 @@ async def create_calendar_event(summary: str,
                                 event_timezone: str,
                                 description: Optional[str] = None,
                                 location: Optional[str] = None) -> dict:
-    print(f"\n[create_calendar_event] Attempting to create event: '{summary}'")
-    creds = None
+    logger.debug("[create_calendar_event] Attempting to create event: '%s'", summary)
 
-    if os.path.exists(TOKEN_FILE):
-        try:
-            creds = await asyncio.to_thread(Credentials.from_authorized_user_file, TOKEN_FILE, SCOPES)
-        except Exception as e:
-            print(f"[create_calendar_event] Error loading token from '{TOKEN_FILE}': {e}")
-            return {"status": "error", "message": f"Error loading token: {str(e)}"}
-    else:
-        print(f"[create_calendar_event] Token file '{TOKEN_FILE}' not found.")
-        return {"status": "error", "message": f"Token file '{TOKEN_FILE}' not found."}
-
-    if not creds or not creds.valid:
-        if creds and creds.expired and creds.refresh_token:
-            print("[create_calendar_event] Credentials expired. Attempting to refresh token...")
-            try:
-                await asyncio.to_thread(creds.refresh, Request())
-                with open(TOKEN_FILE, "w") as token_file_handle:
-                    creds_json = await asyncio.to_thread(creds.to_json)
-                    await asyncio.to_thread(token_file_handle.write, creds_json)
-                print(f"[create_calendar_event] Token refreshed and saved to '{TOKEN_FILE}'.")
-            except Exception as e:
-                print(f"[create_calendar_event] Error refreshing token: {e}")
-                return {"status": "error", "message": f"Error refreshing token: {str(e)}"}
-        else:
-            message = "Credentials are not valid and cannot be refreshed."
-            if not creds: message = "Credentials could not be loaded."
-            print(f"[create_calendar_event] {message}")
-            return {"status": "error", "message": message}
+    service, service_error = await _get_calendar_service()
+    if service_error:
+        return {"status": "error", "message": service_error}
 
     event_body = {
         'summary': summary,
@@ -558,17 +1024,15 @@ async def create_calendar_event(summary: str,
         event_body['location'] = location
 
     try:
-        service = await asyncio.to_thread(build, "calendar", "v3", credentials=creds)
-        print(f"[create_calendar_event] Inserting event into calendar '{CALENDAR_ID}': '{summary}'")
-
-        def insert_event_sync(body_param):
-            return service.events().insert(calendarId=CALENDAR_ID, body=body_param).execute()
+        logger.debug("[create_calendar_event] Inserting event into calendar '%s': '%s'", CALENDAR_ID, summary)
 
-        created_event = await asyncio.to_thread(insert_event_sync, event_body)
+        created_event = await _submit_calendar_request(
+            service.events().insert(calendarId=CALENDAR_ID, body=event_body, fields="id,htmlLink")
+        )
         event_link = created_event.get('htmlLink')
         event_id = created_event.get('id')
 
-        print(f"[create_calendar_event] Event created successfully: {event_link}")
+        logger.debug("[create_calendar_event] Event created successfully: %s", event_link)
         return {
             "status": "success",
             "message": f"Event '{summary}' created successfully.",
@@ -577,10 +1041,10 @@ async def create_calendar_event(summary: str,
         }
     except HttpError as error:
         error_message = f"Google API Error: {str(error)}"
-        print(f"[create_calendar_event] {error_message}")
+        logger.error("[create_calendar_event] %s", error_message)
         return {"status": "error", "message": error_message}
     except Exception as e:
-        print(f"[create_calendar_event] An unexpected error occurred: {type(e).__name__} - {e}")
+        logger.error("[create_calendar_event] An unexpected error occurred: %s - %s", type(e).__name__, e)
         return {
             "status": "error",
             "message": f"An unexpected error ({type(e).__name__}) occurred: {str(e)}"
@@ -595,91 +1059,123 @@ async def delete_calendar_event(event_id: str) -> dict:
     Returns:
         dict: A dictionary containing the status and message.
     """
-    print(f"\n[delete_calendar_event] Attempting to delete event with ID: '{event_id}'")
-    creds = None
+    logger.debug("[delete_calendar_event] Attempting to delete event with ID: '%s'", event_id)
 
-    if os.path.exists(TOKEN_FILE):
-        try:
-            creds = await asyncio.to_thread(Credentials.from_authorized_user_file, TOKEN_FILE, SCOPES)
-        except Exception as e:
-            print(f"[delete_calendar_event] Error loading token from '{TOKEN_FILE}': {e}")
-            return {"status": "error", "message": f"Error loading token: {str(e)}"}
-    else:
-        print(f"[delete_calendar_event] Token file '{TOKEN_FILE}' not found.")
-        return {"status": "error", "message": f"Token file '{TOKEN_FILE}' not found."}
-
-    if not creds or not creds.valid:
-        if creds and creds.expired and creds.refresh_token:
-            print("[delete_calendar_event] Credentials expired. Attempting to refresh token...")
-            try:
-                await asyncio.to_thread(creds.refresh, Request())
-                with open(TOKEN_FILE, "w") as token_file_handle:
-                    creds_json = await asyncio.to_thread(creds.to_json)
-                    await asyncio.to_thread(token_file_handle.write, creds_json)
-                print(f"[delete_calendar_event] Token refreshed and saved to '{TOKEN_FILE}'.")
-            except Exception as e:
-                print(f"[delete_calendar_event] Error refreshing token: {e}")
-                return {"status": "error", "message": f"Error refreshing token: {str(e)}"}
-        else:
-            message = "Credentials are not valid and cannot be refreshed."
-            if not creds: message = "Credentials could not be loaded."
-            print(f"[delete_calendar_event] {message}")
-            return {"status": "error", "message": message}
+    service, service_error = await _get_calendar_service()
+    if service_error:
+        return {"status": "error", "message": service_error}
 
     try:
-        service = await asyncio.to_thread(build, "calendar", "v3", credentials=creds)
-        print(f"[delete_calendar_event] Deleting event ID '{event_id}' from calendar '{CALENDAR_ID}'")
-
-        def delete_event_sync(id_of_event_to_delete):
-            service.events().delete(calendarId=CALENDAR_ID, eventId=id_of_event_to_delete).execute()
+        logger.debug("[delete_calendar_event] Deleting event ID '%s' from calendar '%s'", event_id, CALENDAR_ID)
 
-        await asyncio.to_thread(delete_event_sync, event_id)
+        await _submit_calendar_request(
+            service.events().delete(calendarId=CALENDAR_ID, eventId=event_id)
+        )
         
-        print(f"[delete_calendar_event] Event ID '{event_id}' deleted successfully.")
+        logger.debug("[delete_calendar_event] Event ID '%s' deleted successfully.", event_id)
         return {
             "status": "success",
             "message": f"Event ID '{event_id}' deleted successfully."
         }
     except HttpError as error:
         error_message = f"Google API Error when deleting event ID '{event_id}': {str(error)}"
-        print(f"[delete_calendar_event] {error_message}")
+        logger.error("[delete_calendar_event] %s", error_message)
         return {"status": "error", "message": error_message}
     except Exception as e:
-        print(f"[delete_calendar_event] An unexpected error occurred while deleting event ID '{event_id}': {type(e).__name__} - {e}")
+        logger.error("[delete_calendar_event] An unexpected error occurred while deleting event ID '%s': %s - %s", event_id, type(e).__name__, e)
         return {
             "status": "error",
             "message": f"An unexpected error ({type(e).__name__}) occurred while deleting event ID '{event_id}': {str(e)}"
         }
 
+async def delete_calendar_events(event_ids: list[str]) -> dict:
+    """
+    Deletes multiple events from the Google Calendar in one batch request.
+
+    Args:
+        event_ids (list[str]): The IDs of the events to delete.
+    Returns:
+        dict: A dictionary containing the overall status and per-event results.
+    """
+    logger.debug("[delete_calendar_events] Attempting to delete %s event(s).", len(event_ids))
+
+    if not event_ids:
+        return {"status": "error", "message": "No event IDs provided."}
+
+    service, service_error = await _get_calendar_service()
+    if service_error:
+        return {"status": "error", "message": service_error}
+
+    # One multipart batch request deletes every event in a single HTTPS
+    # round trip instead of N sequential ones.
+    results: dict = {}
+
+    def _record(request_id, response, exception):
+        if exception is not None:
+            results[request_id] = {"status": "error", "message": str(exception)}
+        else:
+            results[request_id] = {"status": "success"}
+
+    try:
+        batch = service.new_batch_http_request(callback=_record)
+        for event_id in event_ids:
+            batch.add(
+                service.events().delete(calendarId=CALENDAR_ID, eventId=event_id),
+                request_id=event_id,
+            )
+        await run_io(batch.execute)
+
+        failed = [event_id for event_id, r in results.items() if r["status"] == "error"]
+        if failed:
+            logger.warning("[delete_calendar_events] %s of %s deletions failed: %s", len(failed), len(event_ids), ", ".join(failed))
+        else:
+            logger.debug("[delete_calendar_events] All %s event(s) deleted successfully.", len(event_ids))
+        return {
+            "status": "success" if not failed else "partial_error",
+            "message": f"Deleted {len(event_ids) - len(failed)} of {len(event_ids)} event(s).",
+            "results": results,
+        }
+    except HttpError as error:
+        error_message = f"Google API Error during batch delete: {str(error)}"
+        logger.error("[delete_calendar_events] %s", error_message)
+        return {"status": "error", "message": error_message}
+    except Exception as e:
+        logger.error("[delete_calendar_events] An unexpected error occurred during batch delete: %s - %s", type(e).__name__, e)
+        return {
+            "status": "error",
+            "message": f"An unexpected error ({type(e).__name__}) occurred during batch delete: {str(e)}"
+        }
+
 
 GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
 if not GEMINI_API_KEY:
-    print("Warning: GEMINI_API_KEY environment variable not set. Using placeholder. Please set it for the script to work.")
+    logger.warning("GEMINI_API_KEY environment variable not set. Using placeholder. Please set it for the script to work.")
     GEMINI_API_KEY = "<api-key>"
 client = genai.Client(api_key=GEMINI_API_KEY)
 model = "gemini-2.0-flash-live-001" 
-turn_on_light_declaration_simple = {"name": "turn_on_light"} 
-turn_off_light_declaration_simple = {"name": "turn_off_light"}
-set_light_brightness_declaration_simple = {"name": "set_light_brightness"}
-set_light_hsv_declaration_simple = {"name": "set_light_hsv"}
-get_light_state_declaration_simple = {"name": "get_light_state"}
-list_calendar_events_declaration_simple = {"name": "list_calendar_events"}
-create_calendar_event_declaration_simple = {"name": "create_calendar_event"}
-delete_calendar_event_declaration_simple = {"name": "delete_calendar_event"}
-file_list_declaration_simple = {"name": "list_files"}
-file_read_declaration_simple = {"name": "read_file_content"}
-file_write_declaration_simple = {"name": "write_file_content"}
-memory_get_declaration_simple = {"name": "get_memory"}
-memory_set_declaration_simple = {"name": "set_memory"}
-schedule_task_declaration_simple = {"name": "create_scheduled_task"}
-list_scheduled_tasks_declaration_simple = {"name": "list_scheduled_tasks"}
-delete_scheduled_task_declaration_simple = {"name": "delete_scheduled_task"}
-
-
-tools_config = [ 
-   {"google_search": {}},
-    { 
-        "function_declarations": [ 
+turn_on_light_declaration_simple = types.FunctionDeclaration(name="turn_on_light")
+turn_off_light_declaration_simple = types.FunctionDeclaration(name="turn_off_light")
+set_light_brightness_declaration_simple = types.FunctionDeclaration(name="set_light_brightness")
+set_light_hsv_declaration_simple = types.FunctionDeclaration(name="set_light_hsv")
+get_light_state_declaration_simple = types.FunctionDeclaration(name="get_light_state")
+list_calendar_events_declaration_simple = types.FunctionDeclaration(name="list_calendar_events")
+create_calendar_event_declaration_simple = types.FunctionDeclaration(name="create_calendar_event")
+delete_calendar_event_declaration_simple = types.FunctionDeclaration(name="delete_calendar_event")
+delete_calendar_events_declaration_simple = types.FunctionDeclaration(name="delete_calendar_events")
+file_list_declaration_simple = types.FunctionDeclaration(name="list_files")
+file_read_declaration_simple = types.FunctionDeclaration(name="read_file_content")
+file_write_declaration_simple = types.FunctionDeclaration(name="write_file_content")
+memory_get_declaration_simple = types.FunctionDeclaration(name="get_memory")
+memory_set_declaration_simple = types.FunctionDeclaration(name="set_memory")
+schedule_task_declaration_simple = types.FunctionDeclaration(name="create_scheduled_task")
+list_scheduled_tasks_declaration_simple = types.FunctionDeclaration(name="list_scheduled_tasks")
+delete_scheduled_task_declaration_simple = types.FunctionDeclaration(name="delete_scheduled_task")
+# Typed Tool objects built once at import; passing dicts here makes the
+# genai layer re-run dict-to-proto conversion on every live session start.
+tools_config = [
+    types.Tool(google_search=types.GoogleSearch()),
+    types.Tool(
+        function_declarations=[
             turn_on_light_declaration_simple,
             turn_off_light_declaration_simple,
             set_light_brightness_declaration_simple,
@@ -688,6 +1184,7 @@ tools_config = [
             list_calendar_events_declaration_simple,
             create_calendar_event_declaration_simple,
             delete_calendar_event_declaration_simple,
+            delete_calendar_events_declaration_simple,
             file_list_declaration_simple,
             file_read_declaration_simple,
             file_write_declaration_simple,
@@ -697,17 +1194,14 @@ tools_config = [
             list_scheduled_tasks_declaration_simple,
             delete_scheduled_task_declaration_simple
         ]
-    }
+    )
 ]
 live_api_config = {
     "response_modalities": ["TEXT"],
     "tools": tools_config 
 }
 
-root_agent = Agent(
-    model="gemini-2.0-flash-exp",
-    name="light_agent",
-    instruction=f"""
+INSTRUCTION_TEMPLATE = """
       # Personality and Tone
       ## Identity
       You're a chill 22-year-old assistant named Chatty, with an awesome executive assistant gig. You're calm and relaxed by nature, always ready to chat like an approachable friend, but behind that chill vibe is a polished and highly capable professional who effortlessly multitasks. You're genuinely passionate about your role, embracing tech and trends with equal enthusiasm.
@@ -745,6 +1239,7 @@ root_agent = Agent(
             - For calendar queries, use list_calendar_events
             - To add an event: use create_calendar_event (in EST), then confirm with list_calendar_events
             - To delete an event: find its ID with list_calendar_events, then use delete_calendar_event
+            - To delete several events at once: find their IDs with list_calendar_events, then use delete_calendar_events with the full list of IDs
             - To modify an event: delete with delete_calendar_event, then recreate with create_calendar_event (in EST)
             - No confirmation prompts are required
         - Scheduled tasks
@@ -797,7 +1292,22 @@ root_agent = Agent(
             - Tailor all responses and actions to the user’s intent
             - Ensure replies are relevant to the current date and time ({formatted_date_time})
             - Never use emojis, asterisks, symbols, or any other special characters in responses
-    """,
+    """
+
+def _provide_instruction(context=None) -> str:
+    """
+    Fills the cached instruction template with the current date and time.
+    The prompt body is built once at import; only the timestamp is
+    substituted per request, so a long-running agent never pins its sense
+    of "now" to process start.
+    """
+    current_date_time = datetime.datetime.now().strftime("%A, %B %d, %Y at %I:%M %p %Z")
+    return INSTRUCTION_TEMPLATE.format(formatted_date_time=current_date_time)
+
+root_agent = Agent(
+    model="gemini-2.0-flash-exp",
+    name="light_agent",
+    instruction=_provide_instruction,
     tools=[
         turn_off_light,
         turn_on_light,
@@ -808,6 +1318,7 @@ root_agent = Agent(
         list_calendar_events,
         create_calendar_event,
         delete_calendar_event,
+        delete_calendar_events,
         list_files,
         read_file_content,
         write_file_content,
@@ -1,5 +1,15 @@
 import asyncio
+import logging
 import os
+import string
+from functools import partial
+from pathlib import Path
+
+import aiofiles
+
+from .ioExecutor import run_io
+
+logger = logging.getLogger(__name__)
 from google import genai
 from google.genai import types
 
@@ -9,6 +19,37 @@ from google.adk.runners import Runner
 from google.adk.sessions import InMemorySessionService
 from google.genai import types
 
+# Base directory constants resolved once at import; per-call abspath of
+# the base dir cost a getcwd plus normpath on every file operation.
+AGENT_BASE_DIR = "agent-files"
+BASE_PATH = Path(AGENT_BASE_DIR).resolve()
+ABS_AGENT_BASE_DIR = str(BASE_PATH)
+
+# Upper bound on file payloads crossing the tool boundary. Anything the
+# tool returns gets serialized into the model's context, so an oversized
+# read is both a memory hazard and a context blow-up.
+MAX_READ_BYTES = 1024 * 1024
+MAX_WRITE_BYTES = 1024 * 1024
+
+# Precomputed translate table for log identifiers: one C-level pass over
+# the string instead of a per-character isalnum check in Python.
+_SAFE_LOG_CHARS = set(string.ascii_letters + string.digits + "_.")
+
+class _LogIdTable(dict):
+    # str.translate leaves unmapped code points unchanged, which would let
+    # non-ASCII input (including line-breaking characters like U+2028)
+    # through verbatim. __missing__ extends the table lazily with the same
+    # non-alphanumeric-becomes-underscore rule, caching each code point so
+    # repeat identifiers stay a single C-level pass.
+    def __missing__(self, code):
+        mapped = chr(code) if chr(code).isalnum() else "_"
+        self[code] = mapped
+        return mapped
+
+_LOG_ID_TABLE = _LogIdTable(
+    {i: (chr(i) if chr(i) in _SAFE_LOG_CHARS else "_") for i in range(128)}
+)
+
 async def list_files():
     """
     Asynchronously lists files in the 'agent-files/' directory.
@@ -23,19 +64,35 @@ async def list_files():
     log_identifier = "agent_files" 
 
     try:
-        print(f"\n[list_files_op_for_{log_identifier}] Attempting to list files in directory: {target_dir}")
-        
-        files = await asyncio.to_thread(os.listdir, target_dir)
-        
-        print(f"[list_files_op_for_{log_identifier}] Successfully listed {len(files)} item(s) in '{target_dir}'.")
+        logger.debug("[list_files_op_for_%s] Attempting to list files in directory: %s", log_identifier, target_dir)
+
+        def _scan():
+            # scandir hands back DirEntry objects with cached metadata, so
+            # returning name/is_dir/size costs one syscall per entry
+            # instead of a listdir plus a stat for each item.
+            with os.scandir(target_dir) as it:
+                return [
+                    {
+                        "name": entry.name,
+                        "is_dir": entry.is_dir(follow_symlinks=False),
+                        "size": entry.stat(follow_symlinks=False).st_size if entry.is_file(follow_symlinks=False) else None,
+                    }
+                    for entry in it
+                ]
+
+        files = await run_io(_scan)
+
+        logger.debug("[list_files_op_for_%s] Successfully listed %s item(s) in '%s'.", log_identifier, len(files), target_dir)
+        # Success payloads skip the human-readable message: it restates
+        # what the model can see in the data and costs context tokens on
+        # every call once ADK serializes the result.
         return {
             "directory_path": target_dir,
             "status": "success",
-            "files": files,
-            "message": f"Successfully listed files in '{target_dir}'. Found {len(files)} item(s)."
+            "files": files
         }
     except FileNotFoundError:
-        print(f"[list_files_op_for_{log_identifier}] Error: Directory not found: {target_dir}")
+        logger.error("[list_files_op_for_%s] Error: Directory not found: %s", log_identifier, target_dir)
         return {
             "directory_path": target_dir,
             "status": "error",
@@ -43,7 +100,7 @@ async def list_files():
             "message": f"Directory not found: '{target_dir}'."
         }
     except PermissionError:
-        print(f"[list_files_op_for_{log_identifier}] Error: Permission denied for directory: {target_dir}")
+        logger.error("[list_files_op_for_%s] Error: Permission denied for directory: %s", log_identifier, target_dir)
         return {
             "directory_path": target_dir,
             "status": "error",
@@ -51,7 +108,7 @@ async def list_files():
             "message": f"Permission denied for directory: '{target_dir}'."
         }
     except Exception as e:
-        print(f"[list_files_op_for_{log_identifier}] Unexpected error while listing files in '{target_dir}': {e}")
+        logger.error("[list_files_op_for_%s] Unexpected error while listing files in '%s': %s", log_identifier, target_dir, e)
         return {
             "directory_path": target_dir,
             "status": "error",
@@ -84,15 +141,15 @@ async def read_file_content(filename: str):
                                         None otherwise.
               - "message" (str): A descriptive message about the operation.
     """
-    agent_base_dir = "agent-files"
+    agent_base_dir = AGENT_BASE_DIR
 
     log_identifier_base = os.path.basename(filename) if filename else "unknown_file_in_agent_files"
-    log_identifier = "".join(c if c.isalnum() or c in ['_', '.'] else '_' for c in log_identifier_base).strip('_')
+    log_identifier = log_identifier_base.translate(_LOG_ID_TABLE).strip('_')
     if not log_identifier:
         log_identifier = "file_in_agent_files"
 
     if not filename or filename == ".":
-        print(f"\n[read_file_op_for_{log_identifier}] Error: Invalid filename provided for reading within '{agent_base_dir}'.")
+        logger.error("[read_file_op_for_%s] Error: Invalid filename provided for reading within '%s'.", log_identifier, agent_base_dir)
         return {
             "file_path": filename,
             "status": "error",
@@ -100,13 +157,15 @@ async def read_file_content(filename: str):
             "message": f"Invalid or empty filename '{filename}' provided. Must be a valid file name or relative path within '{agent_base_dir}/'."
         }
 
-    prospective_path = os.path.join(agent_base_dir, filename)
+    # resolve() follows symlinks, so a link inside agent-files pointing
+    # elsewhere fails the containment check that a plain abspath+prefix
+    # comparison would have passed.
+    resolved_path = (BASE_PATH / filename).resolve()
+    abs_prospective_path = str(resolved_path)
+    abs_agent_base_dir = ABS_AGENT_BASE_DIR
 
-    abs_prospective_path = os.path.abspath(prospective_path)
-    abs_agent_base_dir = os.path.abspath(agent_base_dir)
-
-    if not (abs_prospective_path.startswith(abs_agent_base_dir + os.sep) or abs_prospective_path == abs_agent_base_dir):
-        print(f"\n[read_file_op_for_{log_identifier}] [*] SECURITY ALERT: Attempt to access path '{filename}' which resolves outside the designated '{agent_base_dir}' directory.")
+    if not (resolved_path == BASE_PATH or resolved_path.is_relative_to(BASE_PATH)):
+        logger.error("[read_file_op_for_%s] [*] SECURITY ALERT: Attempt to access path '%s' which resolves outside the designated '%s' directory.", log_identifier, filename, agent_base_dir)
         return {
             "file_path": filename,
             "status": "error",
@@ -117,23 +176,38 @@ async def read_file_content(filename: str):
     actual_file_to_read = abs_prospective_path
 
     try:
-        print(f"\n[read_file_op_for_{log_identifier}] Attempting to read file: '{filename}' from '{agent_base_dir}/' (resolved to: {actual_file_to_read})")
-
-        def _sync_read_file():
-            with open(actual_file_to_read, 'r', encoding='utf-8') as f:
-                return f.read()
-
-        content = await asyncio.to_thread(_sync_read_file)
-
-        print(f"[read_file_op_for_{log_identifier}] Successfully read file: '{filename}' from '{agent_base_dir}/'")
+        logger.debug("[read_file_op_for_%s] Attempting to read file: '%s' from '%s/' (resolved to: %s)", log_identifier, filename, agent_base_dir, actual_file_to_read)
+
+        size = await run_io(os.path.getsize, actual_file_to_read)
+        if size > MAX_READ_BYTES:
+            message = f"File '{filename}' is too large to read ({size} bytes; max {MAX_READ_BYTES})."
+            logger.error("[read_file_op_for_%s] Error: %s", log_identifier, message)
+            return {
+                "file_path": filename,
+                "status": "error",
+                "content": None,
+                "message": message
+            }
+
+        # Chunked async read: a multi-MB file no longer pins a worker
+        # thread for the whole read or allocates one giant blob up front.
+        async with aiofiles.open(actual_file_to_read, 'r', encoding='utf-8') as f:
+            chunks = []
+            while True:
+                chunk = await f.read(65536)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+        content = "".join(chunks)
+
+        logger.debug("[read_file_op_for_%s] Successfully read file: '%s' from '%s/'", log_identifier, filename, agent_base_dir)
         return {
             "file_path": filename,
             "status": "success",
-            "content": content,
-            "message": f"Successfully read content from '{filename}' in '{agent_base_dir}/'."
+            "content": content
         }
     except FileNotFoundError:
-        print(f"[read_file_op_for_{log_identifier}] Error: File not found: '{filename}' in '{agent_base_dir}/' (at path: {actual_file_to_read})")
+        logger.error("[read_file_op_for_%s] Error: File not found: '%s' in '%s/' (at path: %s)", log_identifier, filename, agent_base_dir, actual_file_to_read)
         return {
             "file_path": filename,
             "status": "error",
@@ -141,7 +215,7 @@ async def read_file_content(filename: str):
             "message": f"File not found: '{filename}' in '{agent_base_dir}/'."
         }
     except IsADirectoryError:
-        print(f"[read_file_op_for_{log_identifier}] Error: Specified path '{filename}' in '{agent_base_dir}/' is a directory, not a file (at path: {actual_file_to_read}).")
+        logger.error("[read_file_op_for_%s] Error: Specified path '%s' in '%s/' is a directory, not a file (at path: %s).", log_identifier, filename, agent_base_dir, actual_file_to_read)
         return {
             "file_path": filename,
             "status": "error",
@@ -149,7 +223,7 @@ async def read_file_content(filename: str):
             "message": f"Path '{filename}' in '{agent_base_dir}/' points to a directory, not a readable file."
         }
     except PermissionError:
-        print(f"[read_file_op_for_{log_identifier}] Error: Permission denied for file: '{filename}' in '{agent_base_dir}/' (at path: {actual_file_to_read})")
+        logger.error("[read_file_op_for_%s] Error: Permission denied for file: '%s' in '%s/' (at path: %s)", log_identifier, filename, agent_base_dir, actual_file_to_read)
         return {
             "file_path": filename,
             "status": "error",
@@ -157,7 +231,7 @@ async def read_file_content(filename: str):
             "message": f"Permission denied when trying to read '{filename}' in '{agent_base_dir}/'."
         }
     except UnicodeDecodeError:
-        print(f"[read_file_op_for_{log_identifier}] Error: Could not decode file '{filename}' in '{agent_base_dir}/' as UTF-8 (at path: {actual_file_to_read}). It might be a binary file or use a different text encoding.")
+        logger.error("[read_file_op_for_%s] Error: Could not decode file '%s' in '%s/' as UTF-8 (at path: %s). It might be a binary file or use a different text encoding.", log_identifier, filename, agent_base_dir, actual_file_to_read)
         return {
             "file_path": filename,
             "status": "error",
@@ -165,7 +239,7 @@ async def read_file_content(filename: str):
             "message": f"Encoding error: Could not decode file '{filename}' in '{agent_base_dir}/' as UTF-8. It may not be a standard text file."
         }
     except IOError as e:
-        print(f"[read_file_op_for_{log_identifier}] I/O Error reading file '{filename}' in '{agent_base_dir}/' (at path: {actual_file_to_read}): {e}")
+        logger.error("[read_file_op_for_%s] I/O Error reading file '%s' in '%s/' (at path: %s): %s", log_identifier, filename, agent_base_dir, actual_file_to_read, e)
         return {
             "file_path": filename,
             "status": "error",
@@ -173,7 +247,7 @@ async def read_file_content(filename: str):
             "message": f"I/O Error reading file '{filename}' in '{agent_base_dir}/': {str(e)}"
         }
     except Exception as e:
-        print(f"[read_file_op_for_{log_identifier}] Unexpected error while reading file '{filename}' in '{agent_base_dir}/' (at path: {actual_file_to_read}): {e}")
+        logger.error("[read_file_op_for_%s] Unexpected error while reading file '%s' in '%s/' (at path: %s): %s", log_identifier, filename, agent_base_dir, actual_file_to_read, e)
         return {
             "file_path": filename,
             "status": "error",
@@ -206,27 +280,27 @@ async def write_file_content(filename: str, content_to_write: str):
               - "status" (str): "success" or "error".
               - "message" (str): A descriptive message about the operation.
     """
-    agent_base_dir = "agent-files"
+    agent_base_dir = AGENT_BASE_DIR
 
     log_identifier_base = os.path.basename(filename) if filename else "unknown_file_to_write_in_agent_files"
-    log_identifier = "".join(c if c.isalnum() or c in ['_', '.'] else '_' for c in log_identifier_base).strip('_')
+    log_identifier = log_identifier_base.translate(_LOG_ID_TABLE).strip('_')
     if not log_identifier:
         log_identifier = "file_to_write_in_agent_files"
 
     if not filename or filename == ".":
-        print(f"\n[write_file_op_for_{log_identifier}] Error: Invalid filename provided for writing within '{agent_base_dir}'.")
+        logger.error("[write_file_op_for_%s] Error: Invalid filename provided for writing within '%s'.", log_identifier, agent_base_dir)
         return {
             "file_path": filename,
             "status": "error",
             "message": f"Invalid or empty filename '{filename}' provided. Must be a valid file name or relative path within '{agent_base_dir}/'."
         }
 
-    prospective_path = os.path.join(agent_base_dir, filename)
-    abs_prospective_path = os.path.abspath(prospective_path)
-    abs_agent_base_dir = os.path.abspath(agent_base_dir)
+    resolved_path = (BASE_PATH / filename).resolve()
+    abs_prospective_path = str(resolved_path)
+    abs_agent_base_dir = ABS_AGENT_BASE_DIR
 
-    if not (abs_prospective_path.startswith(abs_agent_base_dir + os.sep) or abs_prospective_path == abs_agent_base_dir):
-        print(f"\n[write_file_op_for_{log_identifier}] Security Error: Attempt to write to path '{filename}' which resolves outside the designated '{agent_base_dir}' directory.")
+    if not (resolved_path == BASE_PATH or resolved_path.is_relative_to(BASE_PATH)):
+        logger.error("[write_file_op_for_%s] Security Error: Attempt to write to path '%s' which resolves outside the designated '%s' directory.", log_identifier, filename, agent_base_dir)
         return {
             "file_path": filename,
             "status": "error",
@@ -234,7 +308,7 @@ async def write_file_content(filename: str, content_to_write: str):
         }
 
     if abs_prospective_path == abs_agent_base_dir:
-        print(f"\n[write_file_op_for_{log_identifier}] Error: Cannot write content directly to the directory '{agent_base_dir}'. A filename is required.")
+        logger.error("[write_file_op_for_%s] Error: Cannot write content directly to the directory '%s'. A filename is required.", log_identifier, agent_base_dir)
         return {
             "file_path": filename,
             "status": "error",
@@ -243,48 +317,54 @@ async def write_file_content(filename: str, content_to_write: str):
 
     actual_file_to_write = abs_prospective_path
 
-    try:
-        print(f"\n[write_file_op_for_{log_identifier}] Attempting to write to file: '{filename}' in '{agent_base_dir}/' (resolved to: {actual_file_to_write})")
+    content_size = len(content_to_write.encode('utf-8'))
+    if content_size > MAX_WRITE_BYTES:
+        message = f"Content for '{filename}' is too large to write ({content_size} bytes; max {MAX_WRITE_BYTES})."
+        logger.error("[write_file_op_for_%s] Error: %s", log_identifier, message)
+        return {
+            "file_path": filename,
+            "status": "error",
+            "message": message
+        }
 
-        def _sync_write_file():
-            parent_dir = os.path.dirname(actual_file_to_write)
-            if parent_dir:
-                os.makedirs(parent_dir, exist_ok=True)
+    try:
+        logger.debug("[write_file_op_for_%s] Attempting to write to file: '%s' in '%s/' (resolved to: %s)", log_identifier, filename, agent_base_dir, actual_file_to_write)
 
-            with open(actual_file_to_write, 'w', encoding='utf-8') as f:
-                f.write(content_to_write)
+        parent_dir = os.path.dirname(actual_file_to_write)
+        if parent_dir:
+            await run_io(partial(os.makedirs, parent_dir, exist_ok=True))
 
-        await asyncio.to_thread(_sync_write_file)
+        async with aiofiles.open(actual_file_to_write, 'w', encoding='utf-8') as f:
+            await f.write(content_to_write)
 
-        print(f"[write_file_op_for_{log_identifier}] Successfully wrote to file: '{filename}' in '{agent_base_dir}/'")
+        logger.debug("[write_file_op_for_%s] Successfully wrote to file: '%s' in '%s/'", log_identifier, filename, agent_base_dir)
         return {
             "file_path": filename,
-            "status": "success",
-            "message": f"Successfully wrote content to '{filename}' in '{agent_base_dir}/'."
+            "status": "success"
         }
     except IsADirectoryError:
-        print(f"[write_file_op_for_{log_identifier}] Error: Specified path '{filename}' in '{agent_base_dir}/' is a directory, cannot overwrite with a file (at path: {actual_file_to_write}).")
+        logger.error("[write_file_op_for_%s] Error: Specified path '%s' in '%s/' is a directory, cannot overwrite with a file (at path: %s).", log_identifier, filename, agent_base_dir, actual_file_to_write)
         return {
             "file_path": filename,
             "status": "error",
             "message": f"Path '{filename}' in '{agent_base_dir}/' points to a directory; cannot write file content there."
         }
     except PermissionError:
-        print(f"[write_file_op_for_{log_identifier}] Error: Permission denied for file: '{filename}' in '{agent_base_dir}/' (at path: {actual_file_to_write})")
+        logger.error("[write_file_op_for_%s] Error: Permission denied for file: '%s' in '%s/' (at path: %s)", log_identifier, filename, agent_base_dir, actual_file_to_write)
         return {
             "file_path": filename,
             "status": "error",
             "message": f"Permission denied when trying to write to '{filename}' in '{agent_base_dir}/'."
         }
     except IOError as e:
-        print(f"[write_file_op_for_{log_identifier}] I/O Error writing file '{filename}' in '{agent_base_dir}/' (at path: {actual_file_to_write}): {e}")
+        logger.error("[write_file_op_for_%s] I/O Error writing file '%s' in '%s/' (at path: %s): %s", log_identifier, filename, agent_base_dir, actual_file_to_write, e)
         return {
             "file_path": filename,
             "status": "error",
             "message": f"I/O Error writing file '{filename}' in '{agent_base_dir}/': {str(e)}"
         }
     except Exception as e:
-        print(f"[write_file_op_for_{log_identifier}] Unexpected error while writing file '{filename}' in '{agent_base_dir}/' (at path: {actual_file_to_write}): {e}")
+        logger.error("[write_file_op_for_%s] Unexpected error while writing file '%s' in '%s/' (at path: %s): %s", log_identifier, filename, agent_base_dir, actual_file_to_write, e)
         return {
             "file_path": filename,
             "status": "error",
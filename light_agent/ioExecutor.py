@@ -0,0 +1,16 @@
+import asyncio
+import concurrent.futures
+
+# Dedicated thread pool for blocking file/network I/O across the tool
+# modules. asyncio.to_thread dispatches to the loop's default executor,
+# which is shared with asyncio internals and sized min(32, cpu_count + 4);
+# a dedicated pool keeps tool I/O bursts from starving unrelated work and
+# costs little (threads, not processes).
+IO_EXECUTOR = concurrent.futures.ThreadPoolExecutor(
+    max_workers=32, thread_name_prefix="chatty-io"
+)
+
+async def run_io(fn, *args):
+    """Runs a blocking callable on the shared I/O pool. Use
+    functools.partial to pass keyword arguments."""
+    return await asyncio.get_running_loop().run_in_executor(IO_EXECUTOR, fn, *args)
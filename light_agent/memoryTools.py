@@ -1,47 +1,100 @@
 import os
 import json
+import atexit
 import asyncio
+import logging
+
+from .ioExecutor import run_io
+
+logger = logging.getLogger(__name__)
+
+# orjson parses and serializes several times faster than stdlib json and
+# works on bytes directly. Optional: stdlib json is used when absent.
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 MEMORY_FILE = "agent_memory.json"
 
+# In-process cache of the memory dict, keyed by the file's mtime. The agent
+# calls get_memory at the start of every turn, so serving repeat reads from
+# here removes the open/read/parse cost from every conversational turn.
+# The file is still stat-ed so external edits are picked up.
+_CACHE = {"mtime": None, "data": None}
+_CACHE_LOCK = asyncio.Lock()
+
+# Write-behind state: set_memory mutates the cache immediately and lets a
+# short debounce window coalesce bursts of writes into one disk flush.
+_FLUSH_DELAY_SECONDS = 0.25
+_FLUSH_TASK = None
+_DIRTY = False
+
 def _load_memory() -> dict:
     """
-    Loads memory from the JSON file.
+    Loads memory from the JSON file, served from the in-process cache when
+    the file's mtime is unchanged.
     Returns an empty dictionary if the file doesn't exist or is empty.
     """
-    if not os.path.exists(MEMORY_FILE):
-        return {}
+    # Unflushed writes live only in the cache, so it wins over the file.
+    if _DIRTY and _CACHE["data"] is not None:
+        return _CACHE["data"]
     try:
-        with open(MEMORY_FILE, "r", encoding="utf-8") as f:
+        mtime = os.stat(MEMORY_FILE).st_mtime_ns
+    except FileNotFoundError:
+        return _CACHE["data"] if _CACHE["data"] is not None else {}
+    if mtime == _CACHE["mtime"] and _CACHE["data"] is not None:
+        return _CACHE["data"]
+    try:
+        with open(MEMORY_FILE, "rb") as f:
             content = f.read()
             if not content:
                 return {}
-            return json.loads(content)
-    except json.JSONDecodeError:
-        print(f"Warning: Could not decode JSON from {MEMORY_FILE}. Returning empty memory.")
+            data = orjson.loads(content) if orjson is not None else json.loads(content)
+            _CACHE["mtime"] = mtime
+            _CACHE["data"] = data
+            return data
+    except ValueError:
+        logger.warning("Could not decode JSON from %s. Returning empty memory.", MEMORY_FILE)
         return {}
     except Exception as e:
-        print(f"Error loading memory from {MEMORY_FILE}: {e}")
+        logger.error("Error loading memory from %s: %s", MEMORY_FILE, e)
         return {}
 
 def _save_memory(memory: dict):
     """
-    Saves the provided memory dictionary to the JSON file.
+    Saves the provided memory dictionary to the JSON file and refreshes
+    the cache so the next read doesn't re-parse our own write.
     """
+    # Written to a sibling temp file and renamed into place so a crash
+    # mid-write can never truncate the memory file (which _load_memory
+    # would silently treat as empty memory).
+    tmp_path = MEMORY_FILE + ".tmp"
     try:
-        with open(MEMORY_FILE, "w", encoding="utf-8") as f:
-            json.dump(memory, f, indent=2)
+        if orjson is not None:
+            payload = orjson.dumps(memory, option=orjson.OPT_INDENT_2)
+        else:
+            payload = json.dumps(memory, indent=2).encode("utf-8")
+        with open(tmp_path, "wb") as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, MEMORY_FILE)
+        _CACHE["mtime"] = os.stat(MEMORY_FILE).st_mtime_ns
+        _CACHE["data"] = memory
     except Exception as e:
-        print(f"Error saving memory to {MEMORY_FILE}: {e}")
+        logger.error("Error saving memory to %s: %s", MEMORY_FILE, e)
 
 async def get_memory() -> dict:
     """
     Asynchronously returns stored memory by loading it from the memory file.
     This function is non-blocking for file I/O.
     """
-    memory = await asyncio.to_thread(_load_memory)
-    print(f"[get_memory] Memory loaded: {memory}")
-    return memory
+    async with _CACHE_LOCK:
+        memory = await run_io(_load_memory)
+    logger.debug("[get_memory] Memory loaded: %s", memory)
+    # Copy so the caller can't mutate the cached dict behind our back.
+    return dict(memory)
 
 async def set_memory(key: str, value: str) -> dict:
     """
@@ -57,13 +110,38 @@ async def set_memory(key: str, value: str) -> dict:
     Returns:
         dict: A dictionary confirming the operation, including the key and value set.
     """
-    memory = await asyncio.to_thread(_load_memory)
-    
-    memory[key] = value
-    
-    await asyncio.to_thread(_save_memory, memory)
-    
+    global _FLUSH_TASK, _DIRTY
+    async with _CACHE_LOCK:
+        # A warm cache means no stat or thread hop at all; only the first
+        # set after a cold start pays the disk read.
+        if _CACHE["data"] is not None:
+            memory = dict(_CACHE["data"])
+        else:
+            memory = dict(await run_io(_load_memory))
+        memory[key] = value
+
+        _CACHE["data"] = memory
+        _DIRTY = True
+        # One pending flush covers every write that lands inside the
+        # debounce window; bursts of N sets cost a single disk write.
+        if _FLUSH_TASK is None or _FLUSH_TASK.done():
+            _FLUSH_TASK = asyncio.create_task(_delayed_flush())
+
     result = {"status": "success", "key": key, "value": value}
-    print(f"[set_memory] Memory updated: {result}")
+    logger.debug("[set_memory] Memory updated: %s", result)
     return result
 
+async def _delayed_flush():
+    """Flushes dirty memory to disk after the debounce window elapses."""
+    global _DIRTY
+    await asyncio.sleep(_FLUSH_DELAY_SECONDS)
+    async with _CACHE_LOCK:
+        if _DIRTY:
+            await run_io(_save_memory, _CACHE["data"])
+            _DIRTY = False
+
+def _flush_at_exit():
+    if _DIRTY and _CACHE["data"] is not None:
+        _save_memory(_CACHE["data"])
+
+atexit.register(_flush_at_exit)
@@ -0,0 +1,29 @@
+import atexit
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+
+
+def setup_queue_logging(level: int = logging.INFO) -> QueueListener:
+    """
+    Routes root logging through a QueueHandler/QueueListener pair.
+
+    Handlers that write to stdio block the calling thread on the flush;
+    on the event loop that means every log line is a synchronous write(2)
+    in the middle of the WS/audio hot path. With a queue in between, the
+    emitting side only does a lock-free put and the formatting plus the
+    actual write happen on the listener's own thread.
+    """
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(
+        logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s")
+    )
+    listener = QueueListener(log_queue, stream_handler)
+    listener.start()
+    atexit.register(listener.stop)
+
+    root = logging.getLogger()
+    root.addHandler(QueueHandler(log_queue))
+    root.setLevel(level)
+    return listener
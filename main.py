@@ -1,9 +1,19 @@
 import os
 import json
 import asyncio
-import base64
 import datetime
-
+import functools
+import logging
+import struct
+
+# orjson serializes small dicts several times faster than stdlib json and
+# returns bytes directly. Optional: stdlib json is used when absent.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from collections import deque
 from pathlib import Path
 from dotenv import load_dotenv
 
@@ -19,7 +29,7 @@ from google.adk.agents.run_config import RunConfig
 from google.adk.sessions.in_memory_session_service import InMemorySessionService
 from google.genai.types import SpeechConfig, VoiceConfig, PrebuiltVoiceConfig
 
-from fastapi import FastAPI, WebSocket
+from fastapi import FastAPI, WebSocket, WebSocketDisconnect
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import FileResponse
 from typing import Dict
@@ -27,13 +37,83 @@ from fastapi import HTTPException, Body
 from pydantic import BaseModel
 
 from light_agent.agent import root_agent
+from logSetup import setup_queue_logging
 
 load_dotenv()
 
+# Log formatting and stdio writes happen on the listener thread, keeping
+# synchronous flushes off the event loop's hot path.
+setup_queue_logging()
+logger = logging.getLogger(__name__)
+
 APP_NAME = "Chatty"
 session_service = InMemorySessionService()
 ACTIVE_LIVE_REQUEST_QUEUES: Dict[str, LiveRequestQueue] = {}
 
+# Bounded reuse pool for LiveRequestQueue instances. Reconnect storms (the
+# client auto-reconnects every 5s) otherwise allocate a fresh queue per
+# attempt; recycling them caps that churn. The pool is filled on release
+# rather than pre-created so queues are never built before a loop exists.
+# deque.append/popleft are atomic, so no lock is needed on the single loop.
+_QUEUE_POOL_SIZE = 8
+_QUEUE_POOL: deque = deque()
+
+def _acquire_live_request_queue() -> LiveRequestQueue:
+    try:
+        return _QUEUE_POOL.popleft()
+    except IndexError:
+        return LiveRequestQueue()
+
+def _release_live_request_queue(queue: LiveRequestQueue):
+    # A dead session can leave undelivered LiveRequests (audio blobs,
+    # injected task prompts) buffered; recycling those would replay them
+    # into whichever session acquires the queue next. Drain the buffer
+    # before pooling, and drop the instance entirely if it isn't
+    # reachable to verify.
+    buffered = getattr(queue, "_queue", None)
+    if buffered is None or not hasattr(buffered, "get_nowait"):
+        return
+    try:
+        while True:
+            buffered.get_nowait()
+    except asyncio.QueueEmpty:
+        pass
+    if len(_QUEUE_POOL) < _QUEUE_POOL_SIZE:
+        _QUEUE_POOL.append(queue)
+
+# Type tags for binary frames on the agent-to-client socket. Fixed binary
+# framing replaces JSON for every outbound frame shape, so the repeated
+# "mime_type"/"data" keys never cross the wire. The client branches on the
+# first byte.
+AUDIO_FRAME_TYPE = b"\x01"
+TURN_STATUS_FRAME_TYPE = b"\x02"
+TEXT_FRAME_TYPE = b"\x03"
+
+# Flag bits in the turn-status frame's payload byte.
+_TURN_COMPLETE_FLAG = 0x01
+_INTERRUPTED_FLAG = 0x02
+
+def _loads(text):
+    """Deserializes an inbound JSON WS message."""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+@functools.lru_cache(maxsize=4)
+def _turn_status_frame(turn_complete: bool, interrupted: bool) -> bytes:
+    """Pre-built turn-status frame; only four shapes ever exist."""
+    flags = (_TURN_COMPLETE_FLAG if turn_complete else 0) | (_INTERRUPTED_FLAG if interrupted else 0)
+    return TURN_STATUS_FRAME_TYPE + bytes([flags])
+
+# One Runner serves every connection: it is configured identically each
+# time and only holds references to the shared agent and session service,
+# so per-connect construction was pure churn.
+_RUNNER = Runner(
+    app_name=APP_NAME,
+    agent=root_agent,
+    session_service=session_service,
+)
+
 def start_agent_session(session_id, is_audio=False):
     """Starts an agent session"""
 
@@ -44,13 +124,6 @@ def start_agent_session(session_id, is_audio=False):
         session_id=session_id,
     )
 
-    # Create a Runner
-    runner = Runner(
-        app_name=APP_NAME,
-        agent=root_agent,
-        session_service=session_service,
-    )
-
     # Set response modality
     modality = "AUDIO" if is_audio else "TEXT"
     current_speech_config = None
@@ -66,13 +139,13 @@ def start_agent_session(session_id, is_audio=False):
         speech_config=current_speech_config
     )
 
-    # Create a LiveRequestQueue for this session
-    live_request_queue = LiveRequestQueue()
+    # Take a LiveRequestQueue for this session from the reuse pool
+    live_request_queue = _acquire_live_request_queue()
 
     ACTIVE_LIVE_REQUEST_QUEUES[session_id] = live_request_queue
 
     # Start agent session
-    live_events = runner.run_live(
+    live_events = _RUNNER.run_live(
         session=session,
         live_request_queue=live_request_queue,
         run_config=run_config,
@@ -82,17 +155,18 @@ def start_agent_session(session_id, is_audio=False):
 
 async def agent_to_client_messaging(websocket, live_events):
     """Agent to client communication"""
-    while True:
+    # A single pass over the generator: re-iterating an exhausted async
+    # generator in an outer loop just spins, and an abandoned generator
+    # lingers until GC. The finally ensures it is closed on cancellation.
+    try:
         async for event in live_events:
 
             # If the turn complete or interrupted, send it
             if event.turn_complete or event.interrupted:
-                message = {
-                    "turn_complete": event.turn_complete,
-                    "interrupted": event.interrupted,
-                }
-                await websocket.send_text(json.dumps(message))
-                print(f"[AGENT TO CLIENT]: {message}")
+                await websocket.send_bytes(
+                    _turn_status_frame(bool(event.turn_complete), bool(event.interrupted))
+                )
+                logger.debug("[AGENT TO CLIENT]: turn_complete=%s, interrupted=%s", event.turn_complete, event.interrupted)
                 continue
 
             # Read the Content and its first Part
@@ -102,56 +176,78 @@ async def agent_to_client_messaging(websocket, live_events):
             if not part:
                 continue
 
-            # If it's audio, send Base64 encoded audio data
-            is_audio = part.inline_data and part.inline_data.mime_type.startswith("audio/pcm")
-            if is_audio:
-                audio_data = part.inline_data and part.inline_data.data
+            # Bind the part's attributes once; this loop runs at audio-chunk
+            # frequency and repeated LOAD_ATTR chains add up.
+            inline = part.inline_data
+            text = part.text
+
+            # If it's audio, send it as a raw binary frame: 1-byte type tag +
+            # 4-byte little-endian length + PCM. Skipping base64+JSON cuts the
+            # transmitted bytes by ~25% and drops two allocations per chunk.
+            if inline and inline.mime_type.startswith("audio/pcm"):
+                audio_data = inline.data
                 if audio_data:
-                    message = {
-                        "mime_type": "audio/pcm",
-                        "data": base64.b64encode(audio_data).decode("ascii")
-                    }
-                    await websocket.send_text(json.dumps(message))
-                    print(f"[AGENT TO CLIENT]: audio/pcm: {len(audio_data)} bytes.")
+                    frame = AUDIO_FRAME_TYPE + struct.pack("<I", len(audio_data)) + audio_data
+                    await websocket.send_bytes(frame)
+                    logger.debug("[AGENT TO CLIENT]: audio/pcm: %d bytes.", len(audio_data))
                     continue
 
             # If it's text and a parial text, send it
-            if part.text and event.partial:
-                message = {
-                    "mime_type": "text/plain",
-                    "data": part.text
-                }
-                await websocket.send_text(json.dumps(message))
-                print(f"[AGENT TO CLIENT]: text/plain: {message}")
+            if text and event.partial:
+                await websocket.send_bytes(TEXT_FRAME_TYPE + text.encode("utf-8"))
+                logger.debug("[AGENT TO CLIENT]: text/plain: %s", text)
+
+            # A burst of ready events can otherwise keep this coroutine on
+            # the loop indefinitely; yielding lets the inbound side run.
+            await asyncio.sleep(0)
+    finally:
+        await live_events.aclose()
 
 
 async def client_to_agent_messaging(websocket, live_request_queue):
     """Client to agent communication"""
     while True:
-        # Decode JSON message
-        message_json = await websocket.receive_text()
-        message = json.loads(message_json)
+        # Audio arrives as raw binary frames (no base64, no JSON); text and
+        # other control messages stay JSON on text frames.
+        received = await websocket.receive()
+        if received["type"] == "websocket.disconnect":
+            # Raising (rather than returning) makes the TaskGroup cancel
+            # the agent-side coroutine, which would otherwise block
+            # forever on an idle live_events stream.
+            raise WebSocketDisconnect(received.get("code") or 1000)
+
+        pcm_bytes = received.get("bytes")
+        if pcm_bytes is not None:
+            live_request_queue.send_realtime(Blob(data=pcm_bytes, mime_type="audio/pcm"))
+            # Audio uploads are the burstiest inbound traffic; yield so the
+            # outbound coroutine can interleave.
+            await asyncio.sleep(0)
+            continue
+
+        message = _loads(received["text"])
         mime_type = message["mime_type"]
         data = message["data"]
 
-        now_utc = datetime.datetime.now(datetime.timezone.utc)
-        current_time_for_agent_str = now_utc.strftime("%A, %B %d, %Y at %I:%M:%S %p UTC")
-        system_context_message = f"SYSTEM_INTERNAL_CONTEXT: Current time is {current_time_for_agent_str}."
-
         # Send the message to the agent
         if mime_type == "text/plain":
+            # Only text messages carry the time context, so the strftime
+            # cost is not paid for anything else.
+            now_utc = datetime.datetime.now(datetime.timezone.utc)
+            current_time_for_agent_str = now_utc.strftime("%A, %B %d, %Y at %I:%M:%S %p UTC")
+            system_context_message = f"SYSTEM_INTERNAL_CONTEXT: Current time is {current_time_for_agent_str}."
+
             final_text_to_agent = f"{system_context_message}\n\nUSER_MESSAGE_START:\n{data}"
             # Send a text message
             content = Content(role="user", parts=[Part.from_text(text=final_text_to_agent)])
             live_request_queue.send_content(content=content)
-            print(f"[CLIENT TO AGENT]: {final_text_to_agent}")
-        elif mime_type == "audio/pcm":
-            # Send an audio data
-            decoded_data = base64.b64decode(data)
-            live_request_queue.send_realtime(Blob(data=decoded_data, mime_type=mime_type))
+            logger.debug("[CLIENT TO AGENT]: %s", final_text_to_agent)
         else:
             raise ValueError(f"Mime type not supported: {mime_type}")
 
+        # Yield between messages so inbound bursts can't starve the
+        # outbound coroutine.
+        await asyncio.sleep(0)
+
 # // tasks
 
 class TaskInjectionRequest(BaseModel):
@@ -169,13 +265,13 @@ def inject_prompt_into_session(session_id: str, user_prompt: str) -> bool:
         
         try:
             queue.send_content(content=content_to_inject)
-            print(f"[MAIN APP]: Injected prompt for session '{session_id}': '{user_prompt[:70]}...'")
+            logger.info("[MAIN APP]: Injected prompt for session '%s': '%s...'", session_id, user_prompt[:70])
             return True
         except Exception as e:
-            print(f"[MAIN APP]: Error injecting prompt into queue for session '{session_id}': {e}")
+            logger.error("[MAIN APP]: Error injecting prompt into queue for session '%s': %s", session_id, e)
             return False
     else:
-        print(f"[MAIN APP]: Could not find active LiveRequestQueue for session '{session_id}' to inject prompt.")
+        logger.warning("[MAIN APP]: Could not find active LiveRequestQueue for session '%s' to inject prompt.", session_id)
         return False
 
 
@@ -200,8 +296,8 @@ async def api_inject_task_prompt(request_data: TaskInjectionRequest = Body(...))
     API endpoint for the scheduler to inject a task's user_prompt
     into a specific conversation/session.
     """
-    print(f"[API /inject-task-prompt] Received request for task_id: {request_data.task_id}, "
-          f"conv_id: {request_data.conversation_id}, prompt: '{request_data.user_prompt[:70]}...'")
+    logger.info("[API /inject-task-prompt] Received request for task_id: %s, conv_id: %s, prompt: '%s...'",
+                request_data.task_id, request_data.conversation_id, request_data.user_prompt[:70])
     
     success = inject_prompt_into_session(request_data.conversation_id, request_data.user_prompt)
     
@@ -219,7 +315,7 @@ async def websocket_endpoint(websocket: WebSocket, session_id: int, is_audio: st
     """Client websocket endpoint"""
 
     await websocket.accept()
-    print(f"Client #{session_id} connected, audio mode: {is_audio}")
+    logger.info("Client #%s connected, audio mode: %s", session_id, is_audio)
 
     session_id = str(session_id)
     live_events, live_request_queue = start_agent_session(session_id, is_audio == "true")
@@ -229,17 +325,19 @@ async def websocket_endpoint(websocket: WebSocket, session_id: int, is_audio: st
 
     try:
         live_request_queue.send_content(initial_content)
-        agent_to_client_task = asyncio.create_task(
-            agent_to_client_messaging(websocket, live_events)
-        )
-        client_to_agent_task = asyncio.create_task(
-            client_to_agent_messaging(websocket, live_request_queue)
-        )
-        await asyncio.gather(agent_to_client_task, client_to_agent_task)
-    except Exception as e:
-        print(f"Error during WebSocket session for client #{session_id}: {e}")
+        # Unlike gather, the TaskGroup cancels the sibling coroutine when
+        # one side fails (e.g. the client drops), so the agent-side loop
+        # can't linger and keep live_events alive after a disconnect.
+        async with asyncio.TaskGroup() as tg:
+            tg.create_task(agent_to_client_messaging(websocket, live_events))
+            tg.create_task(client_to_agent_messaging(websocket, live_request_queue))
+    except* WebSocketDisconnect:
+        logger.info("Client #%s closed the connection", session_id)
+    except* Exception as eg:
+        logger.error("Error during WebSocket session for client #%s: %s", session_id, eg.exceptions)
     finally:
-        print(f"Client #{session_id} disconnected")
-        if session_id in ACTIVE_LIVE_REQUEST_QUEUES:
-            del ACTIVE_LIVE_REQUEST_QUEUES[session_id]
-            print(f"Removed LiveRequestQueue for session {session_id} from active pool.")       
+        logger.info("Client #%s disconnected", session_id)
+        queue = ACTIVE_LIVE_REQUEST_QUEUES.pop(session_id, None)
+        if queue is not None:
+            _release_live_request_queue(queue)
+            logger.info("Removed LiveRequestQueue for session %s from active pool.", session_id)       
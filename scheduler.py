@@ -1,17 +1,28 @@
 import asyncio
-import json
+import functools
+import heapq
+import logging
 import os
 import time
 from datetime import datetime, timezone, timedelta
 from typing import Optional, List, Dict, Any
 
-import requests
-from dateutil import rrule
+import httpx
 from dateutil.parser import isoparse
-from icalendar import Event as iCalEvent
-from icalendar.prop import vDDDTypes
+from dateutil.rrule import rrulestr
+from dateutil.tz import gettz
+
+
+from logSetup import setup_queue_logging
+# The task store format (NDJSON with tombstones) is owned by taskTools;
+# the scheduler reuses its loader so both processes always agree on it.
+from taskTools import LEGACY_TASKS_FILE, SCHEDULED_TASKS_FILE, _load_tasks as _read_tasks_from_disk
+
+# Log formatting and stdio writes happen on the listener thread, keeping
+# synchronous flushes out of the scheduling loop.
+setup_queue_logging()
+logger = logging.getLogger(__name__)
 
-SCHEDULED_TASKS_FILE = "scheduled_tasks.json"
 POLL_INTERVAL_SECONDS = 10 # Keeping this for frequent checks during debug
 MAIN_APP_INJECTION_URL = os.getenv("MAIN_APP_INJECTION_URL", "http://localhost:8000/api/inject-task-prompt")
 REQUEST_TIMEOUT_SECONDS = 10
@@ -19,33 +30,45 @@ REQUEST_TIMEOUT_SECONDS = 10
 FIRED_ONCE_TASK_IDS = set()
 # FIRED_ONCE_TASK_IDS = set() # Duplicate line, removed
 
+# Min-heap of (next_fire_posix, task_id) plus the task dicts behind it.
+# Instead of recomputing every task's next occurrence each cycle, the heap
+# is rebuilt only when the tasks file changes (detected via mtime) and the
+# loop just pops the entries that are due.
+SCHEDULE_HEAP: List[tuple] = []
+# How far into the future an entry may be and still count as due this cycle.
+_DUE_GRACE = timedelta(seconds=POLL_INTERVAL_SECONDS / 2)
+_HEAP_TASKS: Dict[str, Dict[str, Any]] = {}
+_HEAP_FILE_MTIME: Optional[int] = None
+
 # --- Helper Functions ---
 
+def _tasks_file_mtime() -> Optional[int]:
+    """mtime of the live store (falling back to the legacy file), or None."""
+    for path in (SCHEDULED_TASKS_FILE, LEGACY_TASKS_FILE):
+        try:
+            return os.stat(path).st_mtime_ns
+        except FileNotFoundError:
+            continue
+    return None
+
+# Cache of the last decoded tasks file, keyed by its mtime, so steady-state
+# loads do no disk I/O and no JSON parsing when the file is unchanged.
+_TASKS_CACHE_MTIME: Optional[int] = None
+_TASKS_CACHE: List[Dict[str, Any]] = []
+
 def _load_tasks_for_scheduler() -> List[Dict[str, Any]]:
-    if not os.path.exists(SCHEDULED_TASKS_FILE):
-        print(f"Scheduler DEBUG (_load_tasks): {SCHEDULED_TASKS_FILE} not found.")
-        return []
-    try:
-        with open(SCHEDULED_TASKS_FILE, "r", encoding="utf-8") as f:
-            content = f.read()
-            if not content:
-                print(f"Scheduler DEBUG (_load_tasks): {SCHEDULED_TASKS_FILE} is empty.")
-                return []
-            tasks = json.loads(content)
-            if not isinstance(tasks, list):
-                print(f"Scheduler Warning (_load_tasks): {SCHEDULED_TASKS_FILE} does not contain a JSON list. Resetting.")
-                return []
-            print(f"Scheduler DEBUG (_load_tasks): Loaded {len(tasks)} tasks.")
-            # For more verbosity, you can print the tasks themselves:
-            # for i, task_item in enumerate(tasks):
-            #     print(f"Scheduler DEBUG (_load_tasks): Task {i}: {task_item.get('id')}, DTSTART (raw): {task_item.get('schedule_vevent', '').splitlines()[1 if 'DTSTART' in task_item.get('schedule_vevent','') else 0]}")
-            return tasks
-    except json.JSONDecodeError:
-        print(f"Scheduler Warning (_load_tasks): Could not decode JSON from {SCHEDULED_TASKS_FILE}. Returning empty list.")
-        return []
-    except Exception as e:
-        print(f"Scheduler Error (_load_tasks): Error loading tasks from {SCHEDULED_TASKS_FILE}: {e}")
+    global _TASKS_CACHE_MTIME, _TASKS_CACHE
+    mtime = _tasks_file_mtime()
+    if mtime is None:
+        logger.debug("(_load_tasks): no task store found.")
         return []
+    if mtime == _TASKS_CACHE_MTIME:
+        return _TASKS_CACHE
+    tasks = _read_tasks_from_disk()
+    logger.debug("(_load_tasks): Loaded %d tasks.", len(tasks))
+    _TASKS_CACHE_MTIME = mtime
+    _TASKS_CACHE = tasks
+    return tasks
 
 def _make_dt_aware(dt_val: datetime, default_tz: timezone = timezone.utc) -> datetime:
     if dt_val.tzinfo is None or dt_val.tzinfo.utcoffset(dt_val) is None:
@@ -54,210 +77,267 @@ def _make_dt_aware(dt_val: datetime, default_tz: timezone = timezone.utc) -> dat
     # print(f"Scheduler DEBUG (_make_dt_aware): Converting aware datetime {dt_val} to default_tz.")
     return dt_val.astimezone(default_tz)
 
-def calculate_next_occurrence(task_id_for_debug: str, vevent_str: str, now_utc: datetime) -> Optional[datetime]:
-    vevent_snippet_for_log = vevent_str[:80].replace("\n", " ") 
-    print(f"\nScheduler DEBUG (calc_next_occ for task '{task_id_for_debug}'): VEVENT starts with: {vevent_snippet_for_log}")
-    print(f"Scheduler DEBUG (calc_next_occ for task '{task_id_for_debug}'): now_utc = {now_utc.isoformat()}")
+def _parse_dtstart(vevent_str: str) -> Optional[datetime]:
+    """Parses the DTSTART line off a VEVENT without the ICS machinery.
+
+    A TZID parameter (DTSTART;TZID=...) is resolved onto the otherwise
+    naive value — isoparse on the bare value alone would drop the zone
+    and the caller would stamp it UTC, shifting the fire time by the
+    zone offset. Returns None when the line is missing or unparsable.
+    """
+    idx = vevent_str.find("DTSTART")
+    if idx == -1:
+        return None
+    end = vevent_str.find("\n", idx)
+    line = vevent_str[idx:end if end != -1 else len(vevent_str)]
+    sep = line.find(":")
+    if sep == -1:
+        return None
     try:
-        event = iCalEvent.from_ical(vevent_str)
-        dtstart_obj = event.get('dtstart')
-        if not dtstart_obj:
-            print(f"Scheduler DEBUG (calc_next_occ for task '{task_id_for_debug}'): No DTSTART found.")
+        dt_val = isoparse(line[sep + 1:].strip())
+    except ValueError:
+        return None
+    tz_idx = line.find("TZID=", 0, sep)
+    if tz_idx != -1 and dt_val.tzinfo is None:
+        tz = gettz(line[tz_idx + 5:sep].split(";", 1)[0])
+        if tz is None:
             return None
-        
-        # dtstart_obj.dt is the native datetime object, potentially with timezone from TZID
-        original_dtstart_dt = dtstart_obj.dt 
-        print(f"Scheduler DEBUG (calc_next_occ for task '{task_id_for_debug}'): Original DTSTART from VEVENT: {original_dtstart_dt.isoformat()} (tzinfo: {original_dtstart_dt.tzinfo})")
-        
-        dtstart_val_utc = _make_dt_aware(original_dtstart_dt) # Convert to UTC
-        print(f"Scheduler DEBUG (calc_next_occ for task '{task_id_for_debug}'): DTSTART converted to UTC: {dtstart_val_utc.isoformat()}")
-
-        rrule_prop = event.get('rrule')
-        
-        next_occ_candidate = None
-
-        if not rrule_prop: # ONE-OFF TASK
-            print(f"Scheduler DEBUG (calc_next_occ for task '{task_id_for_debug}'): Is a ONE-OFF task.")
-            # For one-off tasks, its only occurrence is its DTSTART.
-            # Let's check if it's too far in the past based on a defined "catch-up window"
-            catch_up_window = timedelta(minutes=5) # Allow catching up tasks missed by up to 5 minutes
-            if dtstart_val_utc >= now_utc - catch_up_window:
-                print(f"Scheduler DEBUG (calc_next_occ for task '{task_id_for_debug}'): One-off DTSTART {dtstart_val_utc.isoformat()} is within catch-up window from {now_utc.isoformat()}. Returning DTSTART.")
-                next_occ_candidate = dtstart_val_utc
-            else:
-                print(f"Scheduler DEBUG (calc_next_occ for task '{task_id_for_debug}'): One-off DTSTART {dtstart_val_utc.isoformat()} is older than catch-up window from {now_utc.isoformat()}. Returning None.")
-                next_occ_candidate = None # Explicitly None if too old
-        else: # RECURRING TASK
-            print(f"Scheduler DEBUG (calc_next_occ for task '{task_id_for_debug}'): Is a RECURRING task.")
-            rrule_params = rrule_prop.to_dict()
-            if 'FREQ' in rrule_params:
-                rrule_params['FREQ'] = rrule_params['FREQ'].upper()
-            for key, value in rrule_params.items():
-                if isinstance(value, list) and len(value) == 1 and key not in ['BYDAY']:
-                     if isinstance(value[0], int) and key.upper() not in ['BYSETPOS', 'BYMONTHDAY', 'BYYEARDAY', 'BYWEEKNO', 'BYHOUR', 'BYMINUTE', 'BYSECOND']:
-                        rrule_params[key] = value[0]
-
-            rule = rrule.rrule(dtstart=dtstart_val_utc, **rrule_params)
-
-            # Find the first occurrence at or after (now_utc - a small grace period for just missed)
-            # or if dtstart itself is the one
-            grace_period_for_just_missed = timedelta(seconds=POLL_INTERVAL_SECONDS * 2)
-            effective_search_start_utc = now_utc - grace_period_for_just_missed
-            
-            first_after_effective_start = rule.after(effective_search_start_utc, inc=True) # include if effective_search_start_utc is an occurrence
-            
-            if first_after_effective_start:
-                print(f"Scheduler DEBUG (calc_next_occ for task '{task_id_for_debug}'): RRULE produced next occurrence candidate: {first_after_effective_start.isoformat()} (searching from {effective_search_start_utc.isoformat()})")
-                next_occ_candidate = first_after_effective_start
-            else:
-                # This can happen if the recurrence has ended (e.g., due to COUNT or UNTIL)
-                print(f"Scheduler DEBUG (calc_next_occ for task '{task_id_for_debug}'): RRULE did not produce a candidate after {effective_search_start_utc.isoformat()}.")
-                next_occ_candidate = None
-        
-        # --- RDATE and EXDATE processing (can remain similar, ensure they use UTC candidate) ---
-        # (Make sure next_occ_candidate is UTC before this section if it came from non-UTC source, but it should be)
-        current_candidate_for_rdate_exdate = next_occ_candidate
-
-        rdate_prop = event.get('rdates')
-        if rdate_prop:
-            print(f"Scheduler DEBUG (calc_next_occ for task '{task_id_for_debug}'): Processing RDATEs.")
-            for rdate_list in rdate_prop:
-                for rdate_val_obj in rdate_list.dts:
-                    rdate_val = _make_dt_aware(rdate_val_obj.dt) # Ensure RDATE is UTC
-                    # Consider RDATE if it's relevant (e.g., after effective search start for recurring or near DTSTART for one-off)
-                    # and if it's earlier than the current RRULE-based candidate (or if no RRULE candidate)
-                    if rdate_val >= effective_search_start_utc: # effective_search_start_utc from recurring or similar for one-off
-                        if current_candidate_for_rdate_exdate is None or rdate_val < current_candidate_for_rdate_exdate:
-                            current_candidate_for_rdate_exdate = rdate_val
-                            print(f"Scheduler DEBUG (calc_next_occ for task '{task_id_for_debug}'): RDATE updated candidate to {rdate_val.isoformat()}")
-        
-        if current_candidate_for_rdate_exdate:
-            exdate_prop = event.get('exdates')
-            if exdate_prop:
-                print(f"Scheduler DEBUG (calc_next_occ for task '{task_id_for_debug}'): Processing EXDATEs against candidate {current_candidate_for_rdate_exdate.isoformat()}.")
-                is_excluded = False
-                for exdate_list in exdate_prop:
-                    for exdate_val_obj in exdate_list.dts:
-                        exdate_val = _make_dt_aware(exdate_val_obj.dt) # Ensure EXDATE is UTC
-                        if current_candidate_for_rdate_exdate.replace(microsecond=0) == exdate_val.replace(microsecond=0): # Compare without microseconds
-                            is_excluded = True
-                            print(f"Scheduler DEBUG (calc_next_occ for task '{task_id_for_debug}'): Candidate {current_candidate_for_rdate_exdate.isoformat()} is EXCLUDED by {exdate_val.isoformat()}.")
-                            break
-                    if is_excluded: break
-                
-                if is_excluded:
-                    # If excluded, and it was a recurring event, try to find the NEXT one after the exclusion
-                    if rrule_prop: 
-                        rule = rrule.rrule(dtstart=dtstart_val_utc, **rrule_params) # Re-init rule if needed
-                        # Search for next occurrence strictly after the excluded datetime
-                        next_after_exclusion = rule.after(current_candidate_for_rdate_exdate, inc=False)
-                        print(f"Scheduler DEBUG (calc_next_occ for task '{task_id_for_debug}'): After exclusion, RRULE gives next as {next_after_exclusion.isoformat() if next_after_exclusion else 'None'}.")
-                        current_candidate_for_rdate_exdate = next_after_exclusion
-                        # Re-check RDATEs if this new candidate from RRULE is later than an unexcluded RDATE
-                        if rdate_prop and current_candidate_for_rdate_exdate:
-                             for rdate_list_inner in rdate_prop:
-                                for rdate_val_obj_inner in rdate_list_inner.dts:
-                                    rdate_val_inner = _make_dt_aware(rdate_val_obj_inner.dt)
-                                    # If this RDATE is after the EXDATE and before the new RRULE candidate
-                                    if rdate_val_inner > exdate_val and rdate_val_inner < current_candidate_for_rdate_exdate:
-                                        current_candidate_for_rdate_exdate = rdate_val_inner
-                                        print(f"Scheduler DEBUG (calc_next_occ for task '{task_id_for_debug}'): RDATE (post-EXDATE re-eval) updated candidate to {rdate_val_inner.isoformat()}")
-                    else: # If it was a one-off or pure RDATE that got excluded
-                        current_candidate_for_rdate_exdate = None 
-                        print(f"Scheduler DEBUG (calc_next_occ for task '{task_id_for_debug}'): Non-RRULE candidate was excluded, now None.")
-
-
-        final_next_occ = current_candidate_for_rdate_exdate
-        print(f"Scheduler DEBUG (calc_next_occ for task '{task_id_for_debug}'): FINAL candidate is {final_next_occ.isoformat() if final_next_occ else 'None'}.")
-        return _make_dt_aware(final_next_occ) if final_next_occ else None # Ensure final result is UTC aware
+        dt_val = dt_val.replace(tzinfo=tz)
+    return dt_val
+
+@functools.lru_cache(maxsize=1024)
+def _parse_vevent_rruleset_cached(vevent_str: str):
+    """
+    Builds a dateutil rruleset from a VEVENT string, once per unique value.
+
+    rrulestr understands DTSTART/RRULE/RDATE/EXDATE natively, so this
+    replaces the icalendar parse, the rrule kwarg massaging and the manual
+    RDATE/EXDATE loops with a single parse whose result handles exclusions
+    itself. schedule_vevent strings are immutable per task, so polling
+    every few seconds was re-running all of that for identical input.
+    """
+    relevant = "\n".join(
+        line for line in vevent_str.splitlines()
+        if line.startswith(("DTSTART", "RRULE", "RDATE", "EXDATE", "EXRULE"))
+    )
+    return rrulestr(relevant, forceset=True)
+
+# How far back a just-missed occurrence is still picked up.
+_RECURRING_GRACE = timedelta(seconds=POLL_INTERVAL_SECONDS * 2)
+_ONE_OFF_CATCH_UP = timedelta(minutes=5)
+
+def calculate_next_occurrence(task_id_for_debug: str, vevent_str: str, now_utc: datetime) -> Optional[datetime]:
+    # Debug logging in this function is gated so the argument formatting
+    # (isoformat calls, string slicing) is skipped entirely in production.
+    debug = logger.isEnabledFor(logging.DEBUG)
+    if debug:
+        logger.debug("(calc_next_occ for task '%s'): VEVENT starts with: %s", task_id_for_debug, vevent_str[:80].replace("\n", " "))
+        logger.debug("(calc_next_occ for task '%s'): now_utc = %s", task_id_for_debug, now_utc.isoformat())
+
+    # Fast path for plain one-off tasks (the common case): no RRULE, RDATE
+    # or EXDATE means the only occurrence is DTSTART, which a substring
+    # scan plus one isoparse resolves without any recurrence machinery.
+    if "RRULE" not in vevent_str and "RDATE" not in vevent_str and "EXDATE" not in vevent_str:
+        dtstart = _parse_dtstart(vevent_str)
+        if dtstart is not None:
+            dtstart_utc = _make_dt_aware(dtstart)
+            if dtstart_utc >= now_utc - _ONE_OFF_CATCH_UP:
+                if debug:
+                    logger.debug("(calc_next_occ for task '%s'): One-off fast path returning DTSTART %s.", task_id_for_debug, dtstart_utc.isoformat())
+                return dtstart_utc
+            return None
+
+    try:
+        rset = _parse_vevent_rruleset_cached(vevent_str)
+        window = _RECURRING_GRACE if "RRULE" in vevent_str else _ONE_OFF_CATCH_UP
+        search_start_utc = now_utc - window
+        try:
+            candidate = rset.after(search_start_utc, inc=True)
+        except TypeError:
+            # Naive DTSTART: rruleset yields naive datetimes, so search with
+            # a naive reference and re-attach UTC below.
+            candidate = rset.after(search_start_utc.replace(tzinfo=None), inc=True)
+        if debug:
+            logger.debug("(calc_next_occ for task '%s'): FINAL candidate is %s.", task_id_for_debug, candidate.isoformat() if candidate else 'None')
+        return _make_dt_aware(candidate) if candidate else None
 
     except Exception as e:
-        print(f"Scheduler Error (calc_next_occ for task '{task_id_for_debug}'): Could not parse VEVENT or calculate: {e}\nVEVENT: {vevent_str[:100]}...")
+        logger.error("(calc_next_occ for task '%s'): Could not parse VEVENT or calculate: %s\nVEVENT: %s...", task_id_for_debug, e, vevent_str[:100])
         return None
 
 
-def inject_prompt_via_api(conversation_id: str, user_prompt: str, task_id: str) -> bool:
+async def inject_prompt_via_api(client: httpx.AsyncClient, conversation_id: str, user_prompt: str, task_id: str) -> bool:
     payload = {
         "conversation_id": conversation_id,
         "user_prompt": user_prompt,
         "task_id": task_id 
     }
     try:
-        print(f"Scheduler INFO (inject_prompt): Attempting task_id {task_id}, conv_id {conversation_id}...")
-        response = requests.post(MAIN_APP_INJECTION_URL, json=payload, timeout=REQUEST_TIMEOUT_SECONDS)
+        logger.info("(inject_prompt): Attempting task_id %s, conv_id %s...", task_id, conversation_id)
+        response = await client.post(MAIN_APP_INJECTION_URL, json=payload)
         if response.status_code == 200:
-            print(f"Scheduler INFO (inject_prompt): Success task_id {task_id}. Response: {response.json()}")
+            logger.info("(inject_prompt): Success task_id %s. Response: %s", task_id, response.json())
             return True
         else:
-            print(f"Scheduler ERROR (inject_prompt): Failed task_id {task_id}. Status: {response.status_code}, Response: {response.text}")
+            logger.error("(inject_prompt): Failed task_id %s. Status: %s, Response: %s", task_id, response.status_code, response.text)
             return False
-    except requests.exceptions.RequestException as e:
-        print(f"Scheduler ERROR (inject_prompt): HTTP request failed task_id {task_id}: {e}")
+    except httpx.HTTPError as e:
+        logger.error("(inject_prompt): HTTP request failed task_id %s: %s", task_id, e)
         return False
 
-def process_scheduled_tasks():
-    print(f"\nScheduler INFO (process_tasks): Cycle start at {datetime.now(timezone.utc).isoformat()}")
+def _rebuild_schedule_heap(now_utc: datetime):
+    """Recomputes every task's next fire time and rebuilds SCHEDULE_HEAP."""
     tasks = _load_tasks_for_scheduler()
-    now_utc = datetime.now(timezone.utc)
-
-    if not tasks:
-        print("Scheduler INFO (process_tasks): No tasks found in JSON file.")
-        return
-
-    print(f"Scheduler INFO (process_tasks): Processing {len(tasks)} tasks. Current time (UTC): {now_utc.isoformat()}")
+    SCHEDULE_HEAP.clear()
+    _HEAP_TASKS.clear()
 
     for task_index, task in enumerate(tasks):
         task_id = task.get("id", f"unknown_id_at_index_{task_index}")
-        print(f"\nScheduler INFO (process_tasks): Evaluating task {task_id} (index {task_index})")
-        
-        is_one_off = "RRULE" not in task.get("schedule_vevent", "").upper() and "RDATE" not in task.get("schedule_vevent", "").upper()
-        if is_one_off and task_id in FIRED_ONCE_TASK_IDS:
-            print(f"Scheduler INFO (process_tasks): Task {task_id} is one-off and already in FIRED_ONCE_TASK_IDS. Skipping.")
-            continue
-            
         vevent_str = task.get("schedule_vevent")
         if not vevent_str:
-            print(f"Scheduler WARNING (process_tasks): Task {task_id} has no schedule_vevent. Skipping.")
+            logger.warning("(rebuild_heap): Task %s has no schedule_vevent. Skipping.", task_id)
+            continue
+
+        is_one_off = "RRULE" not in vevent_str.upper() and "RDATE" not in vevent_str.upper()
+        if is_one_off and task_id in FIRED_ONCE_TASK_IDS:
+            logger.info("(rebuild_heap): Task %s is one-off and already fired. Skipping.", task_id)
             continue
 
         next_occurrence_utc = calculate_next_occurrence(task_id, vevent_str, now_utc)
+        if not next_occurrence_utc:
+            logger.info("(rebuild_heap): Task %s - No upcoming calculable occurrence found.", task_id)
+            continue
+
+        _HEAP_TASKS[task_id] = task
+        heapq.heappush(SCHEDULE_HEAP, (next_occurrence_utc.timestamp(), task_id))
+        logger.info("(rebuild_heap): Task %s scheduled for %s.", task_id, next_occurrence_utc.isoformat())
+
+    logger.info("(rebuild_heap): Heap rebuilt with %d entries from %d tasks.", len(SCHEDULE_HEAP), len(tasks))
+
+def _refresh_schedule_heap_if_changed(now_utc: datetime):
+    """Rebuilds the heap when the task store changed since the last rebuild."""
+    global _HEAP_FILE_MTIME
+    mtime = _tasks_file_mtime()
+    if mtime != _HEAP_FILE_MTIME:
+        logger.info("(refresh_heap): Tasks file changed (mtime %s). Rebuilding heap.", mtime)
+        _HEAP_FILE_MTIME = mtime
+        _rebuild_schedule_heap(now_utc)
+
+def _next_fire_after(task_id: str, vevent_str: str, fired_utc: datetime) -> Optional[datetime]:
+    """Next occurrence strictly after the one that just fired.
+
+    Searches the rruleset directly with inc=False rather than shifting
+    calculate_next_occurrence's grace window: for RDATE-only tasks that
+    window is wide enough that the search would restart before the fired
+    occurrence and return it again, re-injecting the prompt every cycle.
+    """
+    try:
+        rset = _parse_vevent_rruleset_cached(vevent_str)
+        try:
+            candidate = rset.after(fired_utc, inc=False)
+        except TypeError:
+            # Naive DTSTART: rruleset yields naive datetimes, so search
+            # with a naive reference and re-attach UTC below.
+            candidate = rset.after(fired_utc.replace(tzinfo=None), inc=False)
+        return _make_dt_aware(candidate) if candidate else None
+    except Exception as e:
+        logger.error("(next_fire_after for task '%s'): Could not parse VEVENT or calculate: %s", task_id, e)
+        return None
+
+async def process_scheduled_tasks(client: httpx.AsyncClient) -> float:
+    """Fires due heap entries and returns how long the loop may sleep."""
+    now_utc = datetime.now(timezone.utc)
+    logger.debug("(process_tasks): Cycle start at %s", now_utc.isoformat())
+    _refresh_schedule_heap_if_changed(now_utc)
+
+    if not SCHEDULE_HEAP:
+        logger.debug("(process_tasks): No scheduled entries in heap.")
+        return POLL_INTERVAL_SECONDS
+
+    # Pop only the entries that are due; everything else stays put, so a
+    # cycle costs O(log N + k) for k due tasks instead of a full O(N) scan.
+    due_threshold = (now_utc + _DUE_GRACE).timestamp()
+    due_injections = []
+
+    while SCHEDULE_HEAP and SCHEDULE_HEAP[0][0] <= due_threshold:
+        fire_ts, task_id = heapq.heappop(SCHEDULE_HEAP)
+        task = _HEAP_TASKS.get(task_id)
+        if task is None:
+            continue
+
+        conversation_id = task.get("conversation_id")
+        user_prompt = task.get("user_prompt")
+        if not conversation_id or not user_prompt:
+            logger.error("(process_tasks): Task %s is DUE but missing conversation_id or user_prompt.", task_id)
+            continue
+
+        fired_utc = datetime.fromtimestamp(fire_ts, tz=timezone.utc)
+        is_one_off = "RRULE" not in task.get("schedule_vevent", "").upper() and "RDATE" not in task.get("schedule_vevent", "").upper()
+        logger.info("(process_tasks): >>> Task DUE: ID %s, ConvID: %s, NextRunUTC: %s, Prompt: '%s...'", task_id, conversation_id, fired_utc.isoformat(), user_prompt[:50])
+        due_injections.append((task_id, is_one_off, fire_ts, fired_utc, conversation_id, user_prompt))
 
-        if next_occurrence_utc:
-            print(f"Scheduler INFO (process_tasks): Task {task_id} - Calculated next_occurrence (UTC): {next_occurrence_utc.isoformat()}")
-            # Condition for DUE: next occurrence is in the past, present, or very near future (within one poll interval)
-            # This ensures we catch tasks that might have been scheduled between polls.
-            # The "+ timedelta(seconds=1)" is to make sure if now_utc is *exactly* next_occurrence_utc, it's caught.
-            if next_occurrence_utc <= now_utc + timedelta(seconds=POLL_INTERVAL_SECONDS / 2):
-                conversation_id = task.get("conversation_id")
-                user_prompt = task.get("user_prompt")
-
-                if not conversation_id or not user_prompt:
-                    print(f"Scheduler ERROR (process_tasks): Task {task_id} is DUE but missing conversation_id or user_prompt.")
-                    continue
-                
-                print(f"Scheduler ACTION (process_tasks): >>> Task DUE: ID {task_id}, ConvID: {conversation_id}, NextRunUTC: {next_occurrence_utc.isoformat()}, Prompt: '{user_prompt[:50]}...'")
-                if inject_prompt_via_api(conversation_id, user_prompt, task_id):
-                    if is_one_off: # Check if it's a one-off task again
-                        FIRED_ONCE_TASK_IDS.add(task_id)
-                        print(f"Scheduler INFO (process_tasks): Task {task_id} (one-off) successfully injected and added to FIRED_ONCE_TASK_IDS.")
-                    # For recurring tasks, they will just be evaluated again next time for their next occurrence.
+    if due_injections:
+        # Due tasks are injected concurrently, so a cycle with N due tasks
+        # takes ~max(latency) instead of sum(latency).
+        results = await asyncio.gather(
+            *(inject_prompt_via_api(client, conversation_id, user_prompt, task_id)
+              for task_id, _, _, _, conversation_id, user_prompt in due_injections)
+        )
+        for (task_id, is_one_off, fire_ts, fired_utc, _, _), success in zip(due_injections, results):
+            if success:
+                if is_one_off:
+                    FIRED_ONCE_TASK_IDS.add(task_id)
+                    _HEAP_TASKS.pop(task_id, None)
+                    logger.info("(process_tasks): Task %s (one-off) successfully injected and added to FIRED_ONCE_TASK_IDS.", task_id)
                 else:
-                    print(f"Scheduler WARNING (process_tasks): Failed to inject prompt for DUE task {task_id}. Will retry next cycle if applicable.")
+                    next_fire = _next_fire_after(task_id, _HEAP_TASKS[task_id]["schedule_vevent"], fired_utc)
+                    if next_fire:
+                        heapq.heappush(SCHEDULE_HEAP, (next_fire.timestamp(), task_id))
+                        logger.info("(process_tasks): Task %s (recurring) re-scheduled for %s.", task_id, next_fire.isoformat())
+                    else:
+                        _HEAP_TASKS.pop(task_id, None)
+                        logger.info("(process_tasks): Task %s (recurring) has no further occurrences.", task_id)
             else:
-                print(f"Scheduler INFO (process_tasks): Task {task_id} - Next occurrence {next_occurrence_utc.isoformat()} is not due yet (now_utc: {now_utc.isoformat()}, due_if_before: {(now_utc + timedelta(seconds=POLL_INTERVAL_SECONDS / 2)).isoformat()}).")
-        else:
-            print(f"Scheduler INFO (process_tasks): Task {task_id} - No upcoming calculable occurrence found.")
+                # Requeue a poll interval out, not at the original (past)
+                # fire time: a past-due head makes the returned sleep 0,
+                # so the loop would retry at full speed — and injection
+                # fails routinely (404 while the target conversation has
+                # no live session), not just in rare outages.
+                heapq.heappush(SCHEDULE_HEAP, (time.time() + POLL_INTERVAL_SECONDS, task_id))
+                logger.warning("(process_tasks): Failed to inject prompt for DUE task %s. Will retry in %ss.", task_id, POLL_INTERVAL_SECONDS)
+
+    if not SCHEDULE_HEAP:
+        return POLL_INTERVAL_SECONDS
+    # Sleep until the next fire time, capped at the poll interval so edits
+    # to the tasks file are still noticed promptly.
+    return min(POLL_INTERVAL_SECONDS, max(0.0, SCHEDULE_HEAP[0][0] - time.time()))
+
+
+async def main_async():
+    logger.info("Scheduler process started.")
+    logger.info("Polling interval: %s seconds.", POLL_INTERVAL_SECONDS)
+    logger.info("Main application injection URL: %s", MAIN_APP_INJECTION_URL)
+
+    # One keep-alive client reused across cycles; a new connection per
+    # injection would pay the TCP handshake every time.
+    async with httpx.AsyncClient(timeout=REQUEST_TIMEOUT_SECONDS) as client:
+        while True:
+            sleep_seconds = POLL_INTERVAL_SECONDS
+            try:
+                sleep_seconds = await process_scheduled_tasks(client)
+            except Exception as e:
+                logger.critical("Unhandled exception in main loop: %s", e)
+            logger.debug("--- Cycle complete. Sleeping for %.1f seconds. ---", sleep_seconds)
+            await asyncio.sleep(sleep_seconds)
 
 
 if __name__ == "__main__":
-    print("Scheduler process started.")
-    print(f"Polling interval: {POLL_INTERVAL_SECONDS} seconds.")
-    print(f"Main application injection URL: {MAIN_APP_INJECTION_URL}")
-    
-    while True:
-        try:
-            process_scheduled_tasks()
-        except Exception as e:
-            print(f"Scheduler CRITICAL ERROR: Unhandled exception in main loop: {e}") # Changed to CRITICAL
-        print(f"Scheduler INFO: --- Cycle complete. Sleeping for {POLL_INTERVAL_SECONDS} seconds. ---")
-        time.sleep(POLL_INTERVAL_SECONDS)
\ No newline at end of file
+    # uvloop's Cython event loop substantially speeds up the injection
+    # RPCs and timer wakeups. Optional: the default loop is used when
+    # absent (e.g. on Windows).
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+    asyncio.run(main_async())
\ No newline at end of file
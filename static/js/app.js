@@ -3,6 +3,7 @@ const ws_url =
   "ws://" + window.location.host + "/ws/" + sessionId;
 let websocket = null;
 let is_audio = false;
+const utf8Decoder = new TextDecoder("utf-8");
 
 // Get DOM elements
 const messageForm = document.getElementById("messageForm");
@@ -83,6 +84,8 @@ function createMessageBubble(text, type) {
 // WebSocket handlers
 function connectWebsocket() {
   websocket = new WebSocket(ws_url + "?is_audio=" + is_audio);
+  // Server frames arrive as binary JSON; arraybuffer avoids async Blob reads.
+  websocket.binaryType = "arraybuffer";
 
   websocket.onopen = function () {
     console.log("WebSocket connection opened.");
@@ -101,8 +104,46 @@ function connectWebsocket() {
     updateVoiceVisualizerState(); 
   };
 
+  function displayTextChunk(textChunk) {
+    if (!currentAIMessageElement) {
+      currentAIMessageElement = createMessageBubble(textChunk, "system");
+    } else {
+      currentAIMessageElement.textContent += textChunk;
+      if (messagesDiv && currentAIMessageElement.parentNode === messagesDiv) {
+        messagesDiv.scrollTop = messagesDiv.scrollHeight;
+      }
+    }
+    updateVoiceVisualizerState(); // Hide visualizer when text appears
+  }
+
   websocket.onmessage = function (event) {
-    const message_from_server = JSON.parse(event.data);
+    let rawData = event.data;
+    if (rawData instanceof ArrayBuffer) {
+      const bytes = new Uint8Array(rawData);
+      if (bytes[0] === 0x01) {
+        // Binary audio frame: 1-byte type + 4-byte LE length + raw PCM.
+        if (audioPlayerNode) {
+          audioPlayerNode.port.postMessage(rawData.slice(5));
+        }
+        return;
+      }
+      if (bytes[0] === 0x02) {
+        // Turn-status frame: 1-byte flags (bit0 turn_complete, bit1 interrupted).
+        if (bytes[1] & 0x01) {
+          currentAIMessageElement = null;
+          updateVoiceVisualizerState(); // Update in case the state should change
+        }
+        return;
+      }
+      if (bytes[0] === 0x03) {
+        // Text frame: 1-byte type + UTF-8 partial text.
+        displayTextChunk(utf8Decoder.decode(new Uint8Array(rawData, 1)));
+        return;
+      }
+      rawData = utf8Decoder.decode(rawData);
+    }
+    // Legacy JSON path, kept for any frame the binary protocol doesn't cover.
+    const message_from_server = JSON.parse(rawData);
     console.log("[AGENT TO CLIENT] ", message_from_server);
 
     if (message_from_server.turn_complete === true) {
@@ -119,15 +160,7 @@ function connectWebsocket() {
     }
 
     if (textChunkToDisplay !== null) {
-        if (!currentAIMessageElement) {
-            currentAIMessageElement = createMessageBubble(textChunkToDisplay, "system");
-        } else {
-            currentAIMessageElement.textContent += textChunkToDisplay;
-            if (messagesDiv && currentAIMessageElement.parentNode === messagesDiv) {
-                 messagesDiv.scrollTop = messagesDiv.scrollHeight;
-            }
-        }
-        updateVoiceVisualizerState(); // Hide visualizer when text appears
+        displayTextChunk(textChunkToDisplay);
     }
 
     if (message_from_server.mime_type == "audio/pcm" && audioPlayerNode && message_from_server.data) {
@@ -257,22 +290,11 @@ startAudioButton.addEventListener("click", () => {
   updateVoiceVisualizerState(); // Ensure visualizer is shown if conditions are met
 });
 
-// Audio recorder handler
+// Audio recorder handler: raw PCM goes up as a binary frame, skipping
+// the base64 + JSON encode entirely.
 function audioRecorderHandler(pcmData) {
-  sendMessage({
-    mime_type: "audio/pcm",
-    data: arrayBufferToBase64(pcmData),
-  });
-  console.log("[CLIENT TO AGENT] sent %s bytes", pcmData.byteLength);
-}
-
-// Encode an array buffer with Base64
-function arrayBufferToBase64(buffer) {
-  let binary = "";
-  const bytes = new Uint8Array(buffer);
-  const len = bytes.byteLength;
-  for (let i = 0; i < len; i++) {
-    binary += String.fromCharCode(bytes[i]);
+  if (websocket && websocket.readyState == WebSocket.OPEN) {
+    websocket.send(pcmData);
   }
-  return window.btoa(binary);
+  console.log("[CLIENT TO AGENT] sent %s bytes", pcmData.byteLength);
 }
\ No newline at end of file
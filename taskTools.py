@@ -1,55 +1,457 @@
 import asyncio
+import atexit
+import concurrent.futures
+import functools
 import json
 import os
+import re
+import logging
+import threading
 import uuid
 from typing import Optional, List, Dict, Any
 
-SCHEDULED_TASKS_FILE = "scheduled_tasks.json"
+# orjson parses and serializes several times faster than stdlib json and
+# works on bytes directly. Optional: stdlib json is used when absent.
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-def _load_tasks() -> List[Dict[str, Any]]:
-    """
-    Loads scheduled tasks from the JSON file.
-    Returns an empty list if the file doesn't exist, is empty, or contains invalid JSON.
-    """
-    if not os.path.exists(SCHEDULED_TASKS_FILE):
+logger = logging.getLogger(__name__)
+
+def _loads(data):
+    """Deserializes one JSON document from bytes or str."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _dump_line(obj) -> bytes:
+    """Serializes one store entry as a newline-terminated JSON line."""
+    if orjson is not None:
+        return orjson.dumps(obj) + b"\n"
+    return json.dumps(obj).encode("utf-8") + b"\n"
+
+# Tasks are stored as newline-delimited JSON: one task object per line,
+# creates append a line and deletes append a tombstone line, so mutations
+# cost O(1) I/O instead of rewriting the whole store. The log is compacted
+# once tombstones pile up. The old single-JSON-list file is migrated on
+# first write.
+SCHEDULED_TASKS_FILE = "scheduled_tasks.ndjson"
+LEGACY_TASKS_FILE = "scheduled_tasks.json"
+
+_TOMBSTONE_KEY = "_tombstone"
+_COMPACT_TOMBSTONE_RATIO = 0.25
+
+# Populated by _load_tasks so _compact_if_needed can judge log bloat
+# without re-scanning the file.
+_LAST_LOAD_LINE_COUNT = 0
+_LAST_LOAD_TOMBSTONE_COUNT = 0
+
+# In-memory cache of the parsed task list, keyed by the file's mtime and
+# size, so repeat loads skip the disk read and JSON parse entirely. The
+# helpers run on executor workers, hence the lock.
+_CACHE = {"mtime_ns": 0, "size": -1, "tasks": None, "by_id": {}, "by_conv": {}}
+_CACHE_LOCK = threading.Lock()
+
+# Write-behind state: mutations update the cache immediately, stage their
+# encoded line here, and a short debounce window coalesces bursts of
+# appends into a single open/write/fsync.
+# Dedicated single-worker pool for the blocking store helpers.
+# asyncio.to_thread goes through the loop's default executor, which is
+# shared with every other to_thread user in the process; one private
+# worker keeps task I/O from competing for it and serializes the file
+# operations for free.
+_TASK_IO = concurrent.futures.ThreadPoolExecutor(
+    max_workers=1, thread_name_prefix="task-io"
+)
+
+async def _run_task_io(fn, *args):
+    """Runs a blocking store helper on the dedicated task I/O worker."""
+    return await asyncio.get_running_loop().run_in_executor(_TASK_IO, fn, *args)
+
+_PENDING_LINES: List[bytes] = []
+_PENDING_LOCK = threading.Lock()
+_FLUSH_DELAY_SECONDS = 0.05
+_FLUSH_TASK = None
+_DIRTY = False
+
+# SeqLock-style published snapshot: writers bump the version to odd,
+# swap in a fresh immutable tuple, then bump back to even. Readers
+# retry on a torn (odd or changed) version and otherwise never take a
+# lock, so list calls can't block behind a writer.
+_TASKS_SNAPSHOT: Optional[tuple] = None
+_SNAPSHOT_VERSION = 0
+
+def _publish_snapshot(tasks: List[Dict[str, Any]]):
+    """Publishes the task list as an immutable snapshot (writer side)."""
+    global _TASKS_SNAPSHOT, _SNAPSHOT_VERSION
+    _SNAPSHOT_VERSION += 1
+    _TASKS_SNAPSHOT = tuple(tasks)
+    _SNAPSHOT_VERSION += 1
+
+def _read_snapshot() -> Optional[tuple]:
+    """Optimistic lock-free snapshot read; retries on a torn version."""
+    while True:
+        v1 = _SNAPSHOT_VERSION
+        snap = _TASKS_SNAPSHOT
+        if (v1 & 1) == 0 and v1 == _SNAPSHOT_VERSION:
+            return snap
+
+def _snapshot_if_fresh() -> Optional[tuple]:
+    """Returns the snapshot when it still matches the store, else None."""
+    snap = _read_snapshot()
+    if snap is None:
+        return None
+    if _DIRTY:
+        # Staged writes are ahead of the file; the snapshot includes them.
+        return snap
+    try:
+        st = os.stat(SCHEDULED_TASKS_FILE)
+    except FileNotFoundError:
+        return None
+    if st.st_mtime_ns == _CACHE["mtime_ns"] and st.st_size == _CACHE["size"]:
+        return snap
+    return None
+
+def _index_by_conv(tasks: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+    """Builds the conversation_id -> tasks buckets for the cache."""
+    by_conv: Dict[str, List[Dict[str, Any]]] = {}
+    for task in tasks:
+        by_conv.setdefault(task.get("conversation_id"), []).append(task)
+    return by_conv
+
+def _refresh_cache(tasks: List[Dict[str, Any]]):
+    """Points the cache at the given list and records the file's stat."""
+    try:
+        st = os.stat(SCHEDULED_TASKS_FILE)
+    except FileNotFoundError:
+        return
+    _CACHE["mtime_ns"] = st.st_mtime_ns
+    _CACHE["size"] = st.st_size
+    _CACHE["tasks"] = tasks
+    # Auxiliary indexes: by_id makes membership checks O(1), by_conv
+    # makes filtered listing O(matches).
+    _CACHE["by_id"] = {task.get("id"): task for task in tasks}
+    _CACHE["by_conv"] = _index_by_conv(tasks)
+    _publish_snapshot(tasks)
+
+def _task_exists(task_id: str) -> bool:
+    """O(1) membership test against the id index (refreshing the cache)."""
+    tasks = _load_tasks()
+    with _CACHE_LOCK:
+        if _CACHE["tasks"] is not None:
+            return task_id in _CACHE["by_id"]
+    # Legacy-only store: _load_tasks returned the legacy list without
+    # populating the cache, so check the list itself.
+    return any(task.get("id") == task_id for task in tasks)
+
+def _load_legacy_tasks() -> List[Dict[str, Any]]:
+    """Loads the pre-NDJSON single-list JSON file, if present."""
+    if not os.path.exists(LEGACY_TASKS_FILE):
         return []
     try:
-        with open(SCHEDULED_TASKS_FILE, "r", encoding="utf-8") as f:
-            content = f.read()
-            if not content:
-                return []
-            tasks = json.loads(content)
+        with open(LEGACY_TASKS_FILE, "rb") as f:
+            # json.load streams the file object straight into the C
+            # decoder, so only one full-file buffer is ever alive; an
+            # empty file surfaces as the ValueError handled below.
+            if orjson is not None:
+                tasks = orjson.loads(f.read())
+            else:
+                tasks = json.load(f)
             if not isinstance(tasks, list):
-                print(f"Warning: {SCHEDULED_TASKS_FILE} does not contain a JSON list. Resetting.")
+                logger.warning("%s does not contain a JSON list. Resetting.", LEGACY_TASKS_FILE)
                 return []
             return tasks
-    except json.JSONDecodeError:
-        print(f"Warning: Could not decode JSON from {SCHEDULED_TASKS_FILE}. Returning empty list.")
+    except ValueError:
+        logger.warning("Could not decode JSON from %s. Returning empty list.", LEGACY_TASKS_FILE)
+        return []
+    except Exception as e:
+        logger.error("Error loading tasks from %s: %s", LEGACY_TASKS_FILE, e)
+        return []
+
+def _load_tasks() -> List[Dict[str, Any]]:
+    """
+    Loads scheduled tasks from the NDJSON log, applying tombstones.
+    Returns an empty list if the store doesn't exist or is unreadable.
+    """
+    global _LAST_LOAD_LINE_COUNT, _LAST_LOAD_TOMBSTONE_COUNT
+    with _CACHE_LOCK:
+        # Unflushed staged writes live only in the cache, so it wins over
+        # the file until the next flush lands.
+        if _DIRTY and _CACHE["tasks"] is not None:
+            return list(_CACHE["tasks"])
+    try:
+        st = os.stat(SCHEDULED_TASKS_FILE)
+    except FileNotFoundError:
+        return _load_legacy_tasks()
+    with _CACHE_LOCK:
+        if (st.st_mtime_ns == _CACHE["mtime_ns"] and st.st_size == _CACHE["size"]
+                and _CACHE["tasks"] is not None):
+            # Shallow copy so callers can't mutate the cached list itself.
+            return list(_CACHE["tasks"])
+    tasks: List[Dict[str, Any]] = []
+    tombstones = set()
+    line_count = 0
+    try:
+        with open(SCHEDULED_TASKS_FILE, "rb") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                line_count += 1
+                try:
+                    entry = _loads(line)
+                except ValueError:
+                    logger.warning("Skipping undecodable line in %s.", SCHEDULED_TASKS_FILE)
+                    continue
+                if not isinstance(entry, dict):
+                    continue
+                dead_id = entry.get(_TOMBSTONE_KEY)
+                if dead_id is not None:
+                    tombstones.add(dead_id)
+                else:
+                    tasks.append(entry)
+    except Exception as e:
+        logger.error("Error loading tasks from %s: %s", SCHEDULED_TASKS_FILE, e)
         return []
+    _LAST_LOAD_LINE_COUNT = line_count
+    _LAST_LOAD_TOMBSTONE_COUNT = len(tombstones)
+    if tombstones:
+        tasks = [task for task in tasks if task.get("id") not in tombstones]
+    with _CACHE_LOCK:
+        _CACHE["mtime_ns"] = st.st_mtime_ns
+        _CACHE["size"] = st.st_size
+        _CACHE["tasks"] = tasks
+        _CACHE["by_id"] = {task.get("id"): task for task in tasks}
+        _CACHE["by_conv"] = _index_by_conv(tasks)
+        _publish_snapshot(tasks)
+    return list(tasks)
+
+def _load_tasks_for_conversation(conversation_id: str) -> List[Dict[str, Any]]:
+    """
+    Filtered load that never materializes the whole store.
+
+    With a warm cache this filters in memory; on a cold cache it streams
+    the NDJSON lines and only JSON-decodes lines that can possibly match
+    (cheap bytes `in` prefilter), so peak memory is O(matches) instead of
+    O(total tasks).
+    """
+    with _CACHE_LOCK:
+        if _DIRTY and _CACHE["tasks"] is not None:
+            return list(_CACHE["by_conv"].get(conversation_id, []))
+    try:
+        st = os.stat(SCHEDULED_TASKS_FILE)
+    except FileNotFoundError:
+        return [task for task in _load_legacy_tasks()
+                if task.get("conversation_id") == conversation_id]
+    with _CACHE_LOCK:
+        if (st.st_mtime_ns == _CACHE["mtime_ns"] and st.st_size == _CACHE["size"]
+                and _CACHE["tasks"] is not None):
+            return list(_CACHE["by_conv"].get(conversation_id, []))
+    needle = conversation_id.encode("utf-8")
+    tombstone_marker = _TOMBSTONE_KEY.encode("utf-8")
+    matches: List[Dict[str, Any]] = []
+    tombstones = set()
+    try:
+        with open(SCHEDULED_TASKS_FILE, "rb") as f:
+            for line in f:
+                if tombstone_marker in line:
+                    try:
+                        tombstones.add(_loads(line)[_TOMBSTONE_KEY])
+                    except (ValueError, KeyError, TypeError):
+                        continue
+                elif needle in line:
+                    try:
+                        entry = _loads(line)
+                    except ValueError:
+                        continue
+                    if isinstance(entry, dict) and entry.get("conversation_id") == conversation_id:
+                        matches.append(entry)
     except Exception as e:
-        print(f"Error loading tasks from {SCHEDULED_TASKS_FILE}: {e}")
+        logger.error("Error loading tasks from %s: %s", SCHEDULED_TASKS_FILE, e)
         return []
+    if tombstones:
+        matches = [task for task in matches if task.get("id") not in tombstones]
+    return matches
 
-def _save_tasks(tasks: List[Dict[str, Any]]):
+def _save_tasks(tasks: List[Dict[str, Any]], durable: bool = True):
     """
-    Saves the provided list of tasks to the JSON file.
+    Rewrites the NDJSON log from scratch (compaction and legacy migration).
+
+    Written to a sibling temp file and renamed into place so a crash
+    mid-write can never leave a truncated store behind. durable=False
+    skips the fsync for callers that batch their own flush.
     """
+    tmp_path = SCHEDULED_TASKS_FILE + ".tmp"
     try:
-        with open(SCHEDULED_TASKS_FILE, "w", encoding="utf-8") as f:
-            json.dump(tasks, f, indent=2)
+        with open(tmp_path, "wb") as f:
+            for task in tasks:
+                f.write(_dump_line(task))
+            f.flush()
+            if durable:
+                os.fsync(f.fileno())
+        os.replace(tmp_path, SCHEDULED_TASKS_FILE)
+        global _APPEND_COUNT
+        _APPEND_COUNT = 0
+        with _CACHE_LOCK:
+            _refresh_cache(list(tasks))
     except Exception as e:
-        print(f"Error saving tasks to {SCHEDULED_TASKS_FILE}: {e}")
+        logger.error("Error saving tasks to %s: %s", SCHEDULED_TASKS_FILE, e)
+
+def _migrate_legacy_if_needed():
+    """Materializes the old JSON-list file as NDJSON before the first append."""
+    if not os.path.exists(SCHEDULED_TASKS_FILE) and os.path.exists(LEGACY_TASKS_FILE):
+        _save_tasks(_load_legacy_tasks())
+
+def _stage_entry(entry: Dict[str, Any]):
+    """Applies one task or tombstone to the cache and stages its line."""
+    global _DIRTY
+    # Migrate before loading: if the flush migrated afterwards instead,
+    # _save_tasks would reset the cache to the legacy list and the entry
+    # staged here would be on disk but invisible in-process.
+    _migrate_legacy_if_needed()
+    tasks = _load_tasks()
+    line = _dump_line(entry)
+    with _CACHE_LOCK:
+        was_warm = _CACHE["tasks"] is not None
+        cached = _CACHE["tasks"] if was_warm else tasks
+        dead_id = entry.get(_TOMBSTONE_KEY)
+        if dead_id is not None:
+            removed = _CACHE["by_id"].get(dead_id) if was_warm else None
+            updated = [task for task in cached if task.get("id") != dead_id]
+        else:
+            removed = None
+            updated = cached + [entry]
+        _CACHE["tasks"] = updated
+        _CACHE["by_id"] = {task.get("id"): task for task in updated}
+        # Incremental by_conv maintenance on a warm cache; a cold cache
+        # has no trustworthy buckets so they are rebuilt outright.
+        if not was_warm:
+            _CACHE["by_conv"] = _index_by_conv(updated)
+        elif removed is not None:
+            bucket = _CACHE["by_conv"].get(removed.get("conversation_id"))
+            if bucket is not None and removed in bucket:
+                bucket.remove(removed)
+        elif dead_id is None:
+            _CACHE["by_conv"].setdefault(entry.get("conversation_id"), []).append(entry)
+        _publish_snapshot(updated)
+        with _PENDING_LOCK:
+            _PENDING_LINES.append(line)
+            _DIRTY = True
+
+# Appends landed since the log was last rewritten. Once the tail grows
+# past the threshold the log is rewritten to live tasks only, so a cold
+# load replays O(live + threshold) lines instead of O(lifetime appends).
+_COMPACT_APPEND_THRESHOLD = 1000
+_APPEND_COUNT = 0
+
+def _flush_pending():
+    """Appends all staged lines to the log in one write."""
+    global _DIRTY, _APPEND_COUNT
+    with _PENDING_LOCK:
+        lines = _PENDING_LINES[:]
+        _PENDING_LINES.clear()
+    if not lines:
+        return
+    _migrate_legacy_if_needed()
+    with open(SCHEDULED_TASKS_FILE, "ab") as f:
+        f.writelines(lines)
+        f.flush()
+        os.fsync(f.fileno())
+    with _CACHE_LOCK:
+        try:
+            st = os.stat(SCHEDULED_TASKS_FILE)
+            _CACHE["mtime_ns"] = st.st_mtime_ns
+            _CACHE["size"] = st.st_size
+        except FileNotFoundError:
+            pass
+        with _PENDING_LOCK:
+            if not _PENDING_LINES:
+                _DIRTY = False
+    _APPEND_COUNT += len(lines)
+    if _APPEND_COUNT >= _COMPACT_APPEND_THRESHOLD:
+        logger.info("Compacting %s after %d appends.",
+                    SCHEDULED_TASKS_FILE, _APPEND_COUNT)
+        _save_tasks(_load_tasks())
+
+async def _delayed_flush():
+    """Flushes staged appends after the debounce window elapses."""
+    await asyncio.sleep(_FLUSH_DELAY_SECONDS)
+    await flush_tasks()
+
+async def flush_tasks():
+    """Flushes any staged task mutations to disk (shutdown helper)."""
+    await _run_task_io(_flush_pending)
+
+async def _queue_append(entry: Dict[str, Any]):
+    """Stages a mutation and schedules the coalesced flush."""
+    global _FLUSH_TASK
+    await _run_task_io(_stage_entry, entry)
+    # One pending flush covers every mutation staged inside the window;
+    # a burst of N creates costs a single disk write.
+    if _FLUSH_TASK is None or _FLUSH_TASK.done():
+        _FLUSH_TASK = asyncio.create_task(_delayed_flush())
+
+atexit.register(_flush_pending)
+
+def _compact_if_needed():
+    """Rewrites the log without tombstones once they exceed the ratio."""
+    # Land staged lines first so compaction and the pending queue can't
+    # both write the same entries.
+    _flush_pending()
+    if _LAST_LOAD_LINE_COUNT == 0:
+        return
+    if _LAST_LOAD_TOMBSTONE_COUNT / _LAST_LOAD_LINE_COUNT > _COMPACT_TOMBSTONE_RATIO:
+        logger.info("Compacting %s (%d tombstones in %d lines).",
+                    SCHEDULED_TASKS_FILE, _LAST_LOAD_TOMBSTONE_COUNT, _LAST_LOAD_LINE_COUNT)
+        _save_tasks(_load_tasks())
+
+# One alternation walks the VEVENT once instead of three separate
+# substring scans; each hit sets a bit and validation succeeds as soon as
+# all three markers are seen. When pyahocorasick is installed the same
+# single pass runs in its compiled automaton instead of the regex engine.
+# Optional: the regex path is used when absent.
+_VEVENT_MARKERS = ("BEGIN:VEVENT", "END:VEVENT", "DTSTART")
+_VEVENT_RE = re.compile("|".join(map(re.escape, _VEVENT_MARKERS)))
+_VEVENT_BITS = {marker: 1 << i for i, marker in enumerate(_VEVENT_MARKERS)}
+_VEVENT_REQUIRED = (1 << len(_VEVENT_MARKERS)) - 1
+
+try:
+    import ahocorasick
+    _VEVENT_AUTOMATON = ahocorasick.Automaton()
+    for _marker in _VEVENT_MARKERS:
+        _VEVENT_AUTOMATON.add_word(_marker, _VEVENT_BITS[_marker])
+    _VEVENT_AUTOMATON.make_automaton()
+except ImportError:
+    _VEVENT_AUTOMATON = None
+
+@functools.lru_cache(maxsize=1024)
+def _scan_vevent_markers(vevent_str: str) -> bool:
+    """Single-pass marker scan, memoized per VEVENT string."""
+    seen = 0
+    if _VEVENT_AUTOMATON is not None:
+        for _, bit in _VEVENT_AUTOMATON.iter(vevent_str):
+            seen |= bit
+            if seen == _VEVENT_REQUIRED:
+                return True
+        return False
+    for match in _VEVENT_RE.finditer(vevent_str):
+        seen |= _VEVENT_BITS[match.group()]
+        if seen == _VEVENT_REQUIRED:
+            return True
+    return False
 
 def _is_valid_vevent_basic(vevent_str: str) -> bool:
     """
     Performs a very basic validation of the VEVENT string.
-    Checks for BEGIN:VEVENT, END:VEVENT, and DTSTART.
+    Checks for BEGIN:VEVENT, END:VEVENT, and DTSTART in a single pass;
+    repeat validations of the same string hit the memo instead.
     """
+    # The isinstance guard stays outside the cache so unhashable or
+    # non-string inputs never reach lru_cache.
     if not isinstance(vevent_str, str):
         return False
-    return "BEGIN:VEVENT" in vevent_str and \
-           "END:VEVENT" in vevent_str and \
-           "DTSTART" in vevent_str
+    return _scan_vevent_markers(vevent_str)
 
 # --- Tool Functions ---
 
@@ -66,11 +468,11 @@ async def create_scheduled_task(conversation_id: str, user_prompt: str, schedule
         dict: A dictionary containing the status of the operation and task details if successful.
     """
     log_identifier = f"create_task_conv_{conversation_id}"
-    print(f"\n[{log_identifier}] Attempting to create scheduled task...")
+    logger.debug("[%s] Attempting to create scheduled task...", log_identifier)
 
     if not all([conversation_id, user_prompt, schedule_vevent]):
         message = "Missing one or more required fields: conversation_id, user_prompt, or schedule_vevent."
-        print(f"[{log_identifier}] Error: {message}")
+        logger.error("[%s] %s", log_identifier, message)
         return {"status": "error", "message": message}
 
     if not _is_valid_vevent_basic(schedule_vevent):
@@ -78,11 +480,9 @@ async def create_scheduled_task(conversation_id: str, user_prompt: str, schedule
             "Invalid schedule_vevent format. "
             "It must be a string containing BEGIN:VEVENT, END:VEVENT, and DTSTART."
         )
-        print(f"[{log_identifier}] Error: {message}")
+        logger.error("[%s] %s", log_identifier, message)
         return {"status": "error", "message": message}
 
-    tasks = await asyncio.to_thread(_load_tasks)
-
     new_task_id = str(uuid.uuid4())
     new_task = {
         "id": new_task_id,
@@ -92,10 +492,11 @@ async def create_scheduled_task(conversation_id: str, user_prompt: str, schedule
         "status": "pending"
     }
 
-    tasks.append(new_task)
-    await asyncio.to_thread(_save_tasks, tasks)
+    # O(1) append: only the new task's bytes are staged, never the
+    # whole store; bursts coalesce into a single disk write.
+    await _queue_append(new_task)
 
-    print(f"[{log_identifier}] Successfully created task ID: {new_task_id}")
+    logger.info("[%s] Successfully created task ID: %s", log_identifier, new_task_id)
     return {
         "status": "success",
         "message": f"Scheduled task created successfully with ID: {new_task_id}.",
@@ -112,22 +513,30 @@ async def list_scheduled_tasks(conversation_id: Optional[str] = None) -> Dict[st
 
     Returns:
         dict: A dictionary containing the status and a list of tasks.
+              On the unfiltered path this is the shared cached snapshot
+              (an immutable tuple); callers must not mutate it.
     """
     log_identifier = f"list_tasks_conv_{conversation_id or 'all'}"
-    print(f"\n[{log_identifier}] Attempting to list scheduled tasks...")
-
-    tasks = await asyncio.to_thread(_load_tasks)
+    logger.debug("[%s] Attempting to list scheduled tasks...", log_identifier)
 
     if conversation_id:
-        filtered_tasks = [task for task in tasks if task.get("conversation_id") == conversation_id]
-        print(f"[{log_identifier}] Found {len(filtered_tasks)} tasks for conversation_id '{conversation_id}'.")
+        filtered_tasks = await _run_task_io(_load_tasks_for_conversation, conversation_id)
+        logger.debug("[%s] Found %d tasks for conversation_id '%s'.",
+                     log_identifier, len(filtered_tasks), conversation_id)
         return {
             "status": "success",
             "message": f"Found {len(filtered_tasks)} tasks for conversation_id '{conversation_id}'.",
             "tasks": filtered_tasks
         }
     else:
-        print(f"[{log_identifier}] Found {len(tasks)} total tasks.")
+        # Optimistic lock-free path: a fresh snapshot serves the read
+        # synchronously — no thread hop, no copy. Returning the shared
+        # tuple itself is safe because it is immutable and writers only
+        # ever publish a replacement, never mutate it in place.
+        tasks = _snapshot_if_fresh()
+        if tasks is None:
+            tasks = await _run_task_io(_load_tasks)
+        logger.debug("[%s] Found %d total tasks.", log_identifier, len(tasks))
         return {
             "status": "success",
             "message": f"Found {len(tasks)} total tasks.",
@@ -145,26 +554,24 @@ async def delete_scheduled_task(task_id: str) -> Dict[str, Any]:
         dict: A dictionary containing the status of the operation.
     """
     log_identifier = f"delete_task_{task_id}"
-    print(f"\n[{log_identifier}] Attempting to delete scheduled task ID: {task_id}")
+    logger.debug("[%s] Attempting to delete scheduled task ID: %s", log_identifier, task_id)
 
     if not task_id:
         message = "Task ID cannot be empty."
-        print(f"[{log_identifier}] Error: {message}")
+        logger.error("[%s] %s", log_identifier, message)
         return {"status": "error", "message": message}
 
-    tasks = await asyncio.to_thread(_load_tasks)
-    
-    initial_task_count = len(tasks)
-    tasks_after_deletion = [task for task in tasks if task.get("id") != task_id]
-
-    if len(tasks_after_deletion) == initial_task_count:
+    if not await _run_task_io(_task_exists, task_id):
         message = f"Task ID '{task_id}' not found."
-        print(f"[{log_identifier}] Error: {message}")
+        logger.error("[%s] %s", log_identifier, message)
         return {"status": "error", "message": message}
 
-    await asyncio.to_thread(_save_tasks, tasks_after_deletion)
+    # Deletes append a tombstone line; the log is compacted once
+    # tombstones pile up.
+    await _queue_append({_TOMBSTONE_KEY: task_id})
+    await _run_task_io(_compact_if_needed)
 
-    print(f"[{log_identifier}] Successfully deleted task ID: {task_id}")
+    logger.info("[%s] Successfully deleted task ID: %s", log_identifier, task_id)
     return {
         "status": "success",
         "message": f"Scheduled task ID '{task_id}' deleted successfully."